@@ -1,75 +1,90 @@
 """
 Analyze saved HTML files to identify parsing strategies.
 """
-from bs4 import BeautifulSoup
+import os
+from functools import lru_cache
+import lxml.html
+from lxml import etree
 import re
 from gold_dashboard.utils import sanitize_vn_number
 
+_VN_NUM_RE = re.compile(r'\d{1,3}(?:[.,]\d{3})+')
+# Saved pages are always written as UTF-8, with or without a meta charset.
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+# Elements whose class mentions "price" in any case
+_PRICE_CLASS_XPATH = etree.XPath(
+    "//*[contains(translate(@class, 'PRICE', 'price'), 'price')]"
+)
+# Text nodes a browser would render (skips script and style bodies)
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style)]"
+)
+
+@lru_cache(maxsize=16)
+def _parse_file(path, mtime):
+    """Parse a saved page once per (path, mtime); edits invalidate the entry."""
+    with open(path, 'rb') as f:
+        return lxml.html.fromstring(f.read(), parser=_HTML_PARSER)
+
+def _load_tree(path):
+    """Return the parsed lxml tree for a saved HTML file, reusing earlier parses."""
+    return _parse_file(path, os.path.getmtime(path))
+
+def _text_lines(tree):
+    """Return the non-empty, stripped visible text nodes of a parsed page."""
+    return [line for line in (t.strip() for t in _VISIBLE_TEXT_XPATH(tree)) if line]
+
 def analyze_sjc():
     print("\n=== Analyzing SJC HTML ===")
-    with open('.cache/sjc_20260201_220142.html', 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'lxml')
+    tree = _load_tree('.cache/sjc_20260201_220142.html')
     
-    tables = soup.find_all('table')
+    tables = tree.xpath('//table')
     print(f"Found {len(tables)} tables")
     
     for i, table in enumerate(tables[:3]):
-        rows = table.find_all('tr')
+        rows = table.xpath('.//tr')
         print(f"\nTable {i} ({len(rows)} rows):")
         for j, row in enumerate(rows[:5]):
-            cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
+            cells = [cell.text_content().strip() for cell in row.xpath('.//td | .//th')]
             if cells:
                 print(f"  Row {j}: {cells}")
 
 def analyze_egcurrency():
     print("\n=== Analyzing EGCurrency HTML ===")
-    with open('.cache/egcurrency_20260201_220147.html', 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'lxml')
-    
-    text = soup.get_text()
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    tree = _load_tree('.cache/egcurrency_20260201_220147.html')
+    lines = _text_lines(tree)
     
     for i, line in enumerate(lines):
-        if 'sell' in line.lower() or 'rate' in line.lower() or 'vnd' in line.lower():
+        lowered = line.lower()
+        if 'sell' in lowered or 'rate' in lowered or 'vnd' in lowered:
             context = lines[max(0, i-2):min(len(lines), i+3)]
             print(f"Found potential rate context: {context}")
             break
     
-    numbers = re.findall(r'\d{1,3}(?:[.,]\d{3})+', text)
+    numbers = [num for line in lines for num in _VN_NUM_RE.findall(line)]
     print(f"\nSample Vietnamese-formatted numbers: {numbers[:10]}")
 
 def analyze_vietstock():
     print("\n=== Analyzing Vietstock HTML ===")
-    with open('.cache/vietstock_20260201_220149.html', 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'lxml')
-    
-    text = soup.get_text()
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    tree = _load_tree('.cache/vietstock_20260201_220149.html')
+    lines = _text_lines(tree)
     
     for i, line in enumerate(lines):
-        if 'vn30' in line.lower() and 'index' in line.lower():
+        lowered = line.lower()
+        if 'vn30' in lowered and 'index' in lowered:
             context = lines[max(0, i-2):min(len(lines), i+5)]
             print(f"Found VN30 context: {context}")
             break
 
 def analyze_coinmarketcap():
     print("\n=== Analyzing CoinMarketCap HTML ===")
-    with open('.cache/coinmarketcap_20260201_220151.html', 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'lxml')
+    tree = _load_tree('.cache/coinmarketcap_20260201_220151.html')
     
-    price_elements = soup.find_all(class_=re.compile(r'price', re.I))
+    price_elements = _PRICE_CLASS_XPATH(tree)
     print(f"Found {len(price_elements)} elements with 'price' in class")
     
     for elem in price_elements[:5]:
-        text = elem.get_text(strip=True)
+        text = elem.text_content().strip()
         if text and any(char.isdigit() for char in text):
             print(f"  Price element: {text[:100]}")
 
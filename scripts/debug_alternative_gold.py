@@ -1,7 +1,9 @@
 """
 Test alternative gold price sources with simpler HTML structures.
 """
+import re
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import warnings
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
@@ -9,6 +11,17 @@ warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 from gold_dashboard.config import HEADERS, REQUEST_TIMEOUT
 from gold_dashboard.utils import sanitize_vn_number
 
+# Gold-related keyword followed (within 200 chars) by a grouped number
+_COMBO_RE = re.compile(
+    r'(?:sjc|vàng|gold|mua|buy|bán|sell).{0,200}?(\d{1,3}(?:[.,]\d{3})+)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# One keep-alive session for every source tried below
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 # Alternative sources
 SOURCES = {
     "PNJ": "https://www.pnj.com.vn/blog/gia-vang/",
@@ -23,7 +36,7 @@ def test_source(name, url):
     print('='*60)
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, verify=False)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT, verify=False)
         response.raise_for_status()
         
         print(f"Status: {response.status_code}")
@@ -32,32 +45,27 @@ def test_source(name, url):
         
         # Save for inspection
         filename = f".cache/{name.lower()}_debug.html"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(response.text)
+        with open(filename, 'wb') as f:
+            f.write(response.content)
         print(f"Saved to: {filename}")
         
         # Quick parse
         soup = BeautifulSoup(response.content, 'lxml')
         text = soup.get_text()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
         
-        # Look for gold-related keywords and prices
-        keywords = ['SJC', 'vàng', 'gold', 'mua', 'buy', 'bán', 'sell']
-        found_lines = []
+        # Look for gold-related keywords with a price shortly after them
+        found_prices = []
         
-        for i, line in enumerate(lines):
-            if any(kw.lower() in line.lower() for kw in keywords):
-                # Check if there's a price nearby
-                for j in range(max(0, i-2), min(len(lines), i+3)):
-                    price = sanitize_vn_number(lines[j])
-                    if price and 1000000 < price < 100000000:
-                        found_lines.append((i, line, lines[j], price))
-                        break
+        for match in _COMBO_RE.finditer(text):
+            price = sanitize_vn_number(match.group(1))
+            if price and 1000000 < price < 100000000:
+                context = " ".join(match.group(0).split())
+                found_prices.append((match.start(), context, match.group(1), price))
         
-        if found_lines:
-            print(f"\nFound {len(found_lines)} potential gold prices:")
-            for idx, (line_num, context, price_text, price_val) in enumerate(found_lines[:5]):
-                print(f"  {idx+1}. Line {line_num}: {context[:50]}...")
+        if found_prices:
+            print(f"\nFound {len(found_prices)} potential gold prices:")
+            for idx, (offset, context, price_text, price_val) in enumerate(found_prices[:5]):
+                print(f"  {idx+1}. Offset {offset}: {context[:50]}...")
                 print(f"     Price text: {price_text} -> {price_val:,.0f}")
         else:
             print("\nNo gold prices found in expected range")
@@ -2,7 +2,7 @@
 Debug script to inspect Mi Hồng HTML structure and test gold price extraction.
 """
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import warnings
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 
@@ -19,26 +19,28 @@ def inspect_mihong():
     )
     response.raise_for_status()
     
-    soup = BeautifulSoup(response.content, 'lxml')
+    tree = lxml.html.fromstring(
+        response.content, parser=lxml.html.HTMLParser(encoding='utf-8')
+    )
     
     # Save HTML for inspection
-    with open('.cache/mihong_debug.html', 'w', encoding='utf-8') as f:
-        f.write(response.text)
+    with open('.cache/mihong_debug.html', 'wb') as f:
+        f.write(response.content)
     print("Saved HTML to .cache/mihong_debug.html")
     
     # Inspect tables
     print("\n=== TABLES ===")
-    tables = soup.find_all('table')
+    tables = tree.xpath('//table')
     print(f"Found {len(tables)} tables")
     
     for i, table in enumerate(tables):
         print(f"\n--- Table {i} ---")
-        rows = table.find_all('tr')
+        rows = table.xpath('.//tr')
         print(f"Rows: {len(rows)}")
         
         for j, row in enumerate(rows[:10]):  # First 10 rows
-            cells = row.find_all(['td', 'th'])
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            cells = row.xpath('.//td | .//th')
+            cell_texts = [cell.text_content().strip() for cell in cells]
             if cell_texts:
                 print(f"  Row {j}: {cell_texts}")
                 
@@ -53,11 +55,10 @@ def inspect_mihong():
     
     # Inspect text content
     print("\n=== TEXT CONTENT (lines with SJC) ===")
-    text = soup.get_text()
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [line for line in (t.strip() for t in tree.itertext()) if line]
     
     for i, line in enumerate(lines):
-        if 'SJC' in line or 'sjc' in line.lower():
+        if 'sjc' in line.lower():
             context_start = max(0, i-2)
             context_end = min(len(lines), i+10)
             print(f"\nFound SJC at line {i}:")
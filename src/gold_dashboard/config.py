@@ -5,6 +5,8 @@ Contains URLs, HTTP headers, CSS selectors, and cache settings.
 
 from decimal import Decimal
 
+from urllib3.util.request import ACCEPT_ENCODING
+
 CACHE_TTL_SECONDS = 600
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -13,7 +15,8 @@ HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9,vi;q=0.8",
-    "Accept-Encoding": "gzip, deflate, br",
+    # gzip/deflate, plus br (brotli) and zstd only when a decoder is installed
+    "Accept-Encoding": ACCEPT_ENCODING,
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
     "Sec-Fetch-Dest": "document",
@@ -69,12 +72,24 @@ LAND_MAX_VALID_VND_PER_M2 = Decimal("800000000")
 # File path for persisting last successful land scrape (relative to project root)
 LAND_LAST_GOOD_SCRAPE_FILE = "data/last_land_scrape.json"
 
+# File path for persisting last successful gold scrape (relative to project root)
+GOLD_LAST_GOOD_SCRAPE_FILE = "data/last_gold_scrape.json"
+
 # Approximate premium of VN black market USD/VND over the official bank rate.
 # Applied when chogia.vn (black market source) is unreachable (e.g., from GH Actions).
 BLACK_MARKET_PREMIUM = Decimal("1.025")  # ~2.5%
 
 REQUEST_TIMEOUT = 10
 
+# Timeout budget (seconds) shared by the scraped sources of a fallback chain:
+# each request's timeout is capped to what is left, and once it is spent the
+# remaining scrapers are skipped.  The chain's final API source is not
+# counted against it and always gets a full REQUEST_TIMEOUT
+FALLBACK_CHAIN_BUDGET = 2 * REQUEST_TIMEOUT
+
+# Scraped HTML/XML bodies larger than this are rejected instead of parsed
+MAX_RESPONSE_BYTES = 2_000_000
+
 CACHE_DIR = ".cache"
 
 # Gasoline price sources (Vietnam retail, government-regulated)
@@ -25,7 +25,8 @@ def format_vn_number(value: Decimal, decimal_places: int = 0) -> str:
     if value is None:
         return "N/A"
     
-    value_str = str(value)
+    is_negative = value < 0
+    value_str = str(abs(value))
     
     if '.' in value_str:
         integer_part, decimal_part = value_str.split('.')
@@ -33,14 +34,9 @@ def format_vn_number(value: Decimal, decimal_places: int = 0) -> str:
         integer_part = value_str
         decimal_part = ""
     
-    integer_part = integer_part.lstrip('-')
-    is_negative = str(value).startswith('-')
-    
-    formatted_int = ""
-    for i, digit in enumerate(reversed(integer_part)):
-        if i > 0 and i % 3 == 0:
-            formatted_int = "." + formatted_int
-        formatted_int = digit + formatted_int
+    # Slice into 3-digit groups from the right and join once
+    groups = [integer_part[max(0, i - 3):i] for i in range(len(integer_part), 0, -3)]
+    formatted_int = ".".join(reversed(groups))
     
     if decimal_part and decimal_places > 0:
         decimal_part = decimal_part[:decimal_places]
@@ -54,19 +50,25 @@ def format_vn_number(value: Decimal, decimal_places: int = 0) -> str:
     return result
 
 
-def get_status_color(timestamp: datetime) -> str:
+_FIVE_MIN = timedelta(minutes=5)
+_TEN_MIN = timedelta(minutes=10)
+
+
+def get_status_color(timestamp: datetime, now: Optional[datetime] = None) -> str:
     """
     Return color based on data freshness.
     
     Green: < 5 min old
     Yellow: 5-10 min old
     Red: > 10 min old
+
+    Pass now when coloring several rows so they share one clock reading.
     """
-    age = datetime.now() - timestamp
+    age = (now or datetime.now()) - timestamp
     
-    if age < timedelta(minutes=5):
+    if age < _FIVE_MIN:
         return "green"
-    elif age < timedelta(minutes=10):
+    elif age < _TEN_MIN:
         return "yellow"
     else:
         return "red"
@@ -88,8 +90,10 @@ def create_dashboard_table(data: DashboardData) -> Table:
     table.add_column("Label", style="bold", width=20)
     table.add_column("Value", width=60)
     
+    now = datetime.now()
+    
     if data.gold:
-        color = get_status_color(data.gold.timestamp)
+        color = get_status_color(data.gold.timestamp, now)
         table.add_row(
             "🟡 Gold",
             Text(f"Buy: {format_vn_number(data.gold.buy_price)} {data.gold.unit}", style=color)
@@ -108,7 +112,7 @@ def create_dashboard_table(data: DashboardData) -> Table:
     table.add_row("", "")
     
     if data.usd_vnd:
-        color = get_status_color(data.usd_vnd.timestamp)
+        color = get_status_color(data.usd_vnd.timestamp, now)
         table.add_row(
             "💵 USD/VND",
             Text(f"Sell Rate: {format_vn_number(data.usd_vnd.sell_rate)} VND/USD", style=color)
@@ -123,7 +127,7 @@ def create_dashboard_table(data: DashboardData) -> Table:
     table.add_row("", "")
     
     if data.bitcoin:
-        color = get_status_color(data.bitcoin.timestamp)
+        color = get_status_color(data.bitcoin.timestamp, now)
         table.add_row(
             "₿ Bitcoin",
             Text(f"BTC to VND: {format_vn_number(data.bitcoin.btc_to_vnd)} VND", style=color)
@@ -138,7 +142,7 @@ def create_dashboard_table(data: DashboardData) -> Table:
     table.add_row("", "")
     
     if data.vn30:
-        color = get_status_color(data.vn30.timestamp)
+        color = get_status_color(data.vn30.timestamp, now)
         change_text = f" ({format_vn_number(data.vn30.change_percent, 2)}%)" if data.vn30.change_percent else ""
         table.add_row(
             "📈 VN30 Index",
@@ -154,7 +158,7 @@ def create_dashboard_table(data: DashboardData) -> Table:
     table.add_row("", "")
 
     if data.land:
-        color = get_status_color(data.land.timestamp)
+        color = get_status_color(data.land.timestamp, now)
         table.add_row(
             "🏠 Land",
             Text(f"Price: {format_vn_number(data.land.price_per_m2)} {data.land.unit}", style=color)
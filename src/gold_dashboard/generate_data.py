@@ -3,12 +3,19 @@ Generate data.json for Firebase web dashboard.
 Fetches data from all repositories and exports to public/data.json.
 """
 
-import json
+import os
 import sys
 import warnings
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import fields
+from functools import singledispatch
+from operator import itemgetter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 from decimal import Decimal
 
@@ -29,139 +36,84 @@ warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 REQUIRED_ASSETS = ("gold", "usd_vnd", "bitcoin", "vn30", "land", "gasoline")
 
 
+@singledispatch
 def decimal_to_float(obj):
     """Convert Decimal objects to float for JSON serialization."""
-    if isinstance(obj, Decimal):
-        return float(obj)
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+@decimal_to_float.register
+def _(obj: Decimal) -> float:
+    return float(obj)
+
+
+# (DashboardData attribute, log label, success noun, repository class)
+_SOURCES = (
+    ("gold", "Gold", "price", GoldRepository),
+    ("usd_vnd", "USD/VND", "rate", CurrencyRepository),
+    ("bitcoin", "Bitcoin", "price", CryptoRepository),
+    ("vn30", "VN30", "index", StockRepository),
+    ("land", "Land", "price", LandRepository),
+    ("gasoline", "Gasoline", "price", GasolineRepository),
+)
+
+
 def fetch_all_data() -> DashboardData:
     """
     Fetch data from all repositories with error handling.
 
-    Each repository is tried independently; if one fails, others continue.
+    Repositories are fetched concurrently since their HTTP calls are
+    independent; if one fails, others continue.
     Cache decorator ensures stale data is returned if source is unavailable.
     """
     data = DashboardData()
 
     print("Fetching data from all sources...")
 
-    try:
-        data.gold = GoldRepository().fetch()
-        print("✓ Gold price fetched")
-    except Exception as e:
-        print(f"⚠ Gold fetch failed: {e}")
+    with ThreadPoolExecutor(max_workers=len(_SOURCES)) as executor:
+        futures = {
+            executor.submit(repo_cls().fetch): (attr, label, noun)
+            for attr, label, noun, repo_cls in _SOURCES
+        }
+        for future in as_completed(futures):
+            attr, label, noun = futures[future]
+            try:
+                setattr(data, attr, future.result())
+                print(f"✓ {label} {noun} fetched")
+            except Exception as e:
+                print(f"⚠ {label} fetch failed: {e}")
 
-    try:
-        data.usd_vnd = CurrencyRepository().fetch()
-        print("✓ USD/VND rate fetched")
-    except Exception as e:
-        print(f"⚠ USD/VND fetch failed: {e}")
+    return data
 
-    try:
-        data.bitcoin = CryptoRepository().fetch()
-        print("✓ Bitcoin price fetched")
-    except Exception as e:
-        print(f"⚠ Bitcoin fetch failed: {e}")
 
-    try:
-        data.vn30 = StockRepository().fetch()
-        print("✓ VN30 index fetched")
-    except Exception as e:
-        print(f"⚠ VN30 fetch failed: {e}")
+@singledispatch
+def _serialize_value(value: Any) -> Any:
+    """
+    Convert a model field for the payload: datetime -> ISO + "Z".
 
-    try:
-        data.land = LandRepository().fetch()
-        print("✓ Land price fetched")
-    except Exception as e:
-        print(f"⚠ Land fetch failed: {e}")
+    Decimals are kept as-is; orjson converts them via decimal_to_float
+    when data.json is written.
+    """
+    return value
 
-    try:
-        data.gasoline = GasolineRepository().fetch()
-        print("✓ Gasoline price fetched")
-    except Exception as e:
-        print(f"⚠ Gasoline fetch failed: {e}")
 
-    return data
+@_serialize_value.register
+def _(value: datetime) -> str:
+    return value.isoformat() + "Z"
 
 
 def serialize_data(data: DashboardData) -> dict:
     """Convert DashboardData to JSON-serializable dictionary."""
     result = {}
 
-    if data.gold:
-        result["gold"] = {
-            "buy_price": float(data.gold.buy_price) if data.gold.buy_price else None,
-            "sell_price": float(data.gold.sell_price) if data.gold.sell_price else None,
-            "unit": data.gold.unit,
-            "source": data.gold.source,
-            "timestamp": (data.gold.timestamp.isoformat() + "Z")
-            if data.gold.timestamp
-            else None,
-        }
-
-    if data.usd_vnd:
-        result["usd_vnd"] = {
-            "sell_rate": float(data.usd_vnd.sell_rate)
-            if data.usd_vnd.sell_rate
-            else None,
-            "source": data.usd_vnd.source,
-            "timestamp": (data.usd_vnd.timestamp.isoformat() + "Z")
-            if data.usd_vnd.timestamp
-            else None,
-        }
-
-    if data.bitcoin:
-        result["bitcoin"] = {
-            "btc_to_vnd": float(data.bitcoin.btc_to_vnd)
-            if data.bitcoin.btc_to_vnd
-            else None,
-            "source": data.bitcoin.source,
-            "timestamp": (data.bitcoin.timestamp.isoformat() + "Z")
-            if data.bitcoin.timestamp
-            else None,
-        }
-
-    if data.vn30:
-        result["vn30"] = {
-            "index_value": float(data.vn30.index_value)
-            if data.vn30.index_value
-            else None,
-            "change_percent": float(data.vn30.change_percent)
-            if data.vn30.change_percent
-            else None,
-            "source": data.vn30.source,
-            "timestamp": (data.vn30.timestamp.isoformat() + "Z")
-            if data.vn30.timestamp
-            else None,
-        }
-
-    if data.land:
-        result["land"] = {
-            "price_per_m2": float(data.land.price_per_m2)
-            if data.land.price_per_m2
-            else None,
-            "location": data.land.location,
-            "unit": data.land.unit,
-            "source": data.land.source,
-            "timestamp": (data.land.timestamp.isoformat() + "Z")
-            if data.land.timestamp
-            else None,
-        }
-
-    if data.gasoline:
-        result["gasoline"] = {
-            "ron95_price": float(data.gasoline.ron95_price),
-            "e5_ron92_price": float(data.gasoline.e5_ron92_price)
-            if data.gasoline.e5_ron92_price
-            else None,
-            "unit": data.gasoline.unit,
-            "source": data.gasoline.source,
-            "timestamp": (data.gasoline.timestamp.isoformat() + "Z")
-            if data.gasoline.timestamp
-            else None,
-        }
+    # Shallow walk of each asset dataclass; dataclasses.asdict would
+    # deep-copy every field only for the copies to be converted again.
+    for asset_field in fields(data):
+        obj = getattr(data, asset_field.name)
+        if obj:
+            result[asset_field.name] = {
+                f.name: _serialize_value(getattr(obj, f.name)) for f in fields(obj)
+            }
 
     # Add metadata
     result["generated_at"] = (
@@ -177,104 +129,122 @@ def _load_previous_payload(output_file: Path) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(output_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(output_file.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
         return None
 
 
-def _assess_payload_health(
-    payload: Dict[str, Any],
-) -> Tuple[Dict[str, Any], bool, List[str]]:
-    """Assess payload quality and flag severe degradation states."""
-    assets_health: Dict[str, Dict[str, Any]] = {}
-    degraded_assets: List[str] = []
-    severe_degradation = False
+def _assess_asset(
+    asset: str,
+    current: Optional[Dict[str, Any]],
+    asset_history: Any,
+    asset_timeseries: Any,
+) -> Tuple[Dict[str, Any], bool]:
+    """Assess one asset section; returns its health entry and severity flag."""
+    reasons: List[str] = []
+    severe = False
+
+    if current is None:
+        reasons.append("missing_current_section")
+        severe = True
+    elif asset == "land" and current.get("price_per_m2") is None:
+        reasons.append("missing_price_per_m2")
+        severe = True
+    elif asset == "gasoline" and current.get("ron95_price") is None:
+        reasons.append("missing_ron95_price")
+        severe = True
+    elif asset == "gasoline":
+        source = str(current.get("source") or "")
+        timestamp_raw = current.get("timestamp")
+
+        if GasolineRepository.is_seed_source(source):
+            reasons.append("seed_source")
+            severe = True
+        elif GasolineRepository.is_fallback_source(source):
+            reasons.append("hardcoded_fallback_source")
+            severe = True
+
+        if timestamp_raw:
+            try:
+                parsed_ts = datetime.fromisoformat(
+                    str(timestamp_raw).replace("Z", "+00:00")
+                )
+                stale_check_ts = (
+                    parsed_ts.replace(tzinfo=None)
+                    if parsed_ts.tzinfo
+                    else parsed_ts
+                )
+                if GasolineRepository.is_stale_timestamp(stale_check_ts):
+                    reasons.append("stale_timestamp")
+                    severe = True
+            except ValueError:
+                reasons.append("invalid_timestamp")
+                severe = True
+    elif asset == "usd_vnd" and current.get("sell_rate") is None:
+        reasons.append("missing_sell_rate")
+        severe = True
+    elif asset == "vn30":
+        source = str(current.get("source") or "").lower()
+        if source.startswith("fallback"):
+            reasons.append("hardcoded_fallback_source")
+
+        if len(asset_timeseries or []) < 2:
+            reasons.append("short_timeseries")
+
+    if isinstance(asset_history, list):
+        missing_periods = [
+            c.get("period", "?")
+            for c in asset_history
+            if c.get("change_percent") is None
+        ]
+        if missing_periods:
+            reasons.append(f"missing_history:{','.join(missing_periods)}")
+
+    entry = {
+        "status": "degraded" if reasons else "ok",
+        "reasons": reasons,
+        "source": current.get("source") if isinstance(current, dict) else None,
+    }
+    return entry, severe
+
 
+def _assess_assets(
+    payload: Dict[str, Any],
+    assets: Tuple[str, ...] = REQUIRED_ASSETS,
+) -> Dict[str, Tuple[Dict[str, Any], bool]]:
+    """Assess the given assets of a payload, keyed by asset name."""
     history = payload.get("history", {})
     timeseries = payload.get("timeseries", {})
+    return {
+        asset: _assess_asset(
+            asset, payload.get(asset), history.get(asset), timeseries.get(asset)
+        )
+        for asset in assets
+    }
 
-    for asset in REQUIRED_ASSETS:
-        reasons: List[str] = []
-        status = "ok"
-        current = payload.get(asset)
-
-        if current is None:
-            reasons.append("missing_current_section")
-            severe_degradation = True
-        elif asset == "land" and current.get("price_per_m2") is None:
-            reasons.append("missing_price_per_m2")
-            severe_degradation = True
-        elif asset == "gasoline" and current.get("ron95_price") is None:
-            reasons.append("missing_ron95_price")
-            severe_degradation = True
-        elif asset == "gasoline":
-            source = str(current.get("source") or "")
-            timestamp_raw = current.get("timestamp")
-
-            if GasolineRepository.is_seed_source(source):
-                reasons.append("seed_source")
-                severe_degradation = True
-            elif GasolineRepository.is_fallback_source(source):
-                reasons.append("hardcoded_fallback_source")
-                severe_degradation = True
-
-            if timestamp_raw:
-                try:
-                    parsed_ts = datetime.fromisoformat(
-                        str(timestamp_raw).replace("Z", "+00:00")
-                    )
-                    stale_check_ts = (
-                        parsed_ts.replace(tzinfo=None)
-                        if parsed_ts.tzinfo
-                        else parsed_ts
-                    )
-                    if GasolineRepository.is_stale_timestamp(stale_check_ts):
-                        reasons.append("stale_timestamp")
-                        severe_degradation = True
-                except ValueError:
-                    reasons.append("invalid_timestamp")
-                    severe_degradation = True
-        elif asset == "usd_vnd" and current.get("sell_rate") is None:
-            reasons.append("missing_sell_rate")
-            severe_degradation = True
-        elif asset == "vn30":
-            source = str(current.get("source") or "").lower()
-            if source.startswith("fallback"):
-                reasons.append("hardcoded_fallback_source")
-
-            vn30_series = timeseries.get("vn30") or []
-            if len(vn30_series) < 2:
-                reasons.append("short_timeseries")
-
-        asset_history = history.get(asset)
-        if isinstance(asset_history, list):
-            missing_periods = [
-                c.get("period", "?")
-                for c in asset_history
-                if c.get("change_percent") is None
-            ]
-            if missing_periods:
-                reasons.append(f"missing_history:{','.join(missing_periods)}")
-
-        if reasons:
-            status = "degraded"
-            degraded_assets.append(asset)
-
-        assets_health[asset] = {
-            "status": status,
-            "reasons": reasons,
-            "source": current.get("source") if isinstance(current, dict) else None,
-        }
 
-    overall_status = "degraded" if degraded_assets else "ok"
+def _summarize_health(
+    verdicts: Dict[str, Tuple[Dict[str, Any], bool]],
+) -> Tuple[Dict[str, Any], bool, List[str]]:
+    """Fold per-asset verdicts into the health block and degradation flags."""
+    degraded_assets = [
+        asset for asset, (entry, _) in verdicts.items() if entry["status"] != "ok"
+    ]
     health = {
-        "overall": overall_status,
-        "assets": assets_health,
+        "overall": "degraded" if degraded_assets else "ok",
+        "assets": {asset: entry for asset, (entry, _) in verdicts.items()},
     }
+    severe_degradation = any(severe for _, severe in verdicts.values())
     return health, severe_degradation, degraded_assets
 
 
+def _assess_payload_health(
+    payload: Dict[str, Any],
+) -> Tuple[Dict[str, Any], bool, List[str]]:
+    """Assess payload quality and flag severe degradation states."""
+    return _summarize_health(_assess_assets(payload))
+
+
 def _restore_degraded_assets_from_lkg(
     payload: Dict[str, Any],
     previous_payload: Dict[str, Any],
@@ -308,15 +278,41 @@ def _restore_degraded_assets_from_lkg(
     return restored_assets
 
 
+# (DashboardData attribute / series key, model field tracked over time)
+_ASSET_VALUE_FIELDS = (
+    ("gold", "sell_price"),
+    ("usd_vnd", "sell_rate"),
+    ("bitcoin", "btc_to_vnd"),
+    ("vn30", "index_value"),
+    ("land", "price_per_m2"),
+    ("gasoline", "ron95_price"),
+)
+
+
+def _current_values(data: DashboardData) -> Iterator[Tuple[str, Any, Decimal]]:
+    """Yield (asset key, model, tracked value) for each asset present in data."""
+    for asset_key, value_field in _ASSET_VALUE_FIELDS:
+        model = getattr(data, asset_key)
+        if model:
+            value = getattr(model, value_field)
+            if value is not None:
+                yield asset_key, model, value
+
+
 def merge_current_into_timeseries(
     timeseries: dict,
     data: DashboardData,
     date_key: Optional[str] = None,
 ) -> dict:
-    """Upsert current snapshot values into same-day timeseries points."""
+    """
+    Upsert current snapshot values into same-day timeseries points.
+
+    Series are sorted by date, so future points are cut with one bisect and
+    today's value only ever replaces or extends the tail.
+    """
     today = date_key or datetime.now(timezone.utc).strftime("%Y-%m-%d")
     merged = {
-        asset: [point for point in points if point[0] <= today]
+        asset: points[: bisect_right(points, today, key=itemgetter(0))]
         for asset, points in timeseries.items()
     }
 
@@ -327,68 +323,41 @@ def merge_current_into_timeseries(
         point = [today, float(value)]
         points = merged.setdefault(asset_key, [])
 
-        for idx, existing in enumerate(points):
-            if existing[0] == today:
-                points[idx] = point
-                break
+        if points and points[-1][0] == today:
+            points[-1] = point
         else:
             points.append(point)
 
-        points.sort(key=lambda p: p[0])
-
-    if data.gold:
-        upsert("gold", data.gold.sell_price)
-    if data.usd_vnd:
-        upsert("usd_vnd", data.usd_vnd.sell_rate)
-    if data.bitcoin:
-        upsert("bitcoin", data.bitcoin.btc_to_vnd)
-    if data.vn30:
-        upsert("vn30", data.vn30.index_value)
-    if data.land:
-        upsert("land", data.land.price_per_m2)
-    if data.gasoline:
-        upsert("gasoline", data.gasoline.ron95_price)
+    for asset_key, _, value in _current_values(data):
+        upsert(asset_key, value)
 
     return merged
 
 
 def _record_current_snapshots(data: DashboardData) -> None:
     """Persist today's values into the local history store."""
-    if data.gold:
-        record_snapshot("gold", data.gold.sell_price)
-    if data.usd_vnd:
-        record_snapshot("usd_vnd", data.usd_vnd.sell_rate)
-    if data.bitcoin:
-        record_snapshot("bitcoin", data.bitcoin.btc_to_vnd)
-    if data.vn30:
-        record_snapshot("vn30", data.vn30.index_value)
-    if data.land:
-        record_snapshot("land", data.land.price_per_m2)
-    if data.gasoline and GasolineRepository.should_record_snapshot(data.gasoline):
-        record_snapshot("gasoline", data.gasoline.ron95_price)
+    for asset_key, model, value in _current_values(data):
+        if asset_key == "gasoline" and not GasolineRepository.should_record_snapshot(
+            model
+        ):
+            continue
+        record_snapshot(asset_key, value)
 
 
 def _serialize_history(history: dict) -> dict:
     """Convert AssetHistoricalData dict to JSON-serializable format."""
     result = {}
     for asset_key, asset_data in history.items():
-        changes = []
-        for c in asset_data.changes:
-            changes.append(
-                {
-                    "period": c.period,
-                    "old_value": float(c.old_value)
-                    if c.old_value is not None
-                    else None,
-                    "new_value": float(c.new_value)
-                    if c.new_value is not None
-                    else None,
-                    "change_percent": float(c.change_percent)
-                    if c.change_percent is not None
-                    else None,
-                }
-            )
-        result[asset_key] = changes
+        # Decimals are left for decimal_to_float at encode time
+        result[asset_key] = [
+            {
+                "period": c.period,
+                "old_value": c.old_value,
+                "new_value": c.new_value,
+                "change_percent": c.change_percent,
+            }
+            for c in asset_data.changes
+        ]
     return result
 
 
@@ -407,8 +376,19 @@ def main():
 
     previous_payload = _load_previous_payload(output_file)
 
-    # Fetch data
-    data = fetch_all_data()
+    # Fetch current data and, alongside it, the raw time-series for the
+    # frontend charts. The time-series only read external APIs and the local
+    # store, so they are collected before the store is written below.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        timeseries_future = executor.submit(HistoryRepository().fetch_timeseries)
+        data = fetch_all_data()
+
+    timeseries = {}
+    try:
+        timeseries = timeseries_future.result()
+        print("✓ Time-series data fetched")
+    except Exception as e:
+        print(f"⚠ Time-series fetch failed: {e}")
 
     # Record current values into local history store for future lookups
     _record_current_snapshots(data)
@@ -421,14 +401,6 @@ def main():
     except Exception as e:
         print(f"⚠ Historical changes fetch failed: {e}")
 
-    # Fetch raw time-series data for frontend charts
-    timeseries = {}
-    try:
-        timeseries = HistoryRepository().fetch_timeseries()
-        print("✓ Time-series data fetched")
-    except Exception as e:
-        print(f"⚠ Time-series fetch failed: {e}")
-
     # Serialize to dictionary
     json_data = serialize_data(data)
 
@@ -440,8 +412,10 @@ def main():
     if timeseries:
         json_data["timeseries"] = merge_current_into_timeseries(timeseries, data)
 
-    # Assess payload health and restore degraded assets from previous payload if needed
-    health, severe_degradation, degraded_assets = _assess_payload_health(json_data)
+    # Assess payload health and restore degraded assets from previous payload if
+    # needed; only the restored assets are re-assessed afterwards
+    verdicts = _assess_assets(json_data)
+    health, severe_degradation, degraded_assets = _summarize_health(verdicts)
     restored_assets: List[str] = []
     if severe_degradation and previous_payload is not None:
         restored_assets = _restore_degraded_assets_from_lkg(
@@ -449,18 +423,26 @@ def main():
             previous_payload,
             degraded_assets,
         )
-        health, severe_degradation, degraded_assets = _assess_payload_health(json_data)
+        if restored_assets:
+            verdicts.update(_assess_assets(json_data, tuple(restored_assets)))
+            health, severe_degradation, degraded_assets = _summarize_health(verdicts)
 
     health["severe_degradation"] = severe_degradation
     if restored_assets:
         health["restored_from_lkg"] = restored_assets
     json_data["health"] = health
 
+    # Write-then-rename so a crash mid-write never truncates the LKG payload.
+    tmp_file = output_file.with_suffix(".json.tmp")
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                json_data, f, ensure_ascii=False, indent=2, default=decimal_to_float
+        tmp_file.write_bytes(
+            orjson.dumps(
+                json_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=decimal_to_float,
             )
+        )
+        os.replace(tmp_file, output_file)
 
         print()
         print(f"✓ Data successfully written to {output_file}")
@@ -490,6 +472,7 @@ def main():
         return 0
 
     except Exception as e:
+        tmp_file.unlink(missing_ok=True)
         print(f"✗ Error writing data.json: {e}")
         return 1
 
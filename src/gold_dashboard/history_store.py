@@ -6,9 +6,12 @@ for assets without external historical APIs (e.g., SJC Gold).
 
 import json
 import os
+import threading
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from operator import itemgetter
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
 from .config import CACHE_DIR
 
@@ -20,26 +23,33 @@ HISTORY_FILE = os.path.join(CACHE_DIR, "history.json")
 # we consider it "not available".
 MAX_LOOKUP_TOLERANCE_DAYS = 3
 
+# Guards HISTORY_FILE: history for several assets is gathered concurrently,
+# so reads must not see a half-written file and record_snapshot's
+# read-modify-write must not interleave with another asset's
+_history_lock = threading.RLock()
+
 
 def _load_history() -> Dict[str, List[Dict[str, Any]]]:
     """Load the full history file from disk. Returns empty dict if missing."""
-    if not os.path.exists(HISTORY_FILE):
-        return {}
-    try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+    with _history_lock:
+        if not os.path.exists(HISTORY_FILE):
+            return {}
+        try:
+            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
 
 
 def _save_history(data: Dict[str, List[Dict[str, Any]]]) -> None:
     """Persist the full history dict to disk."""
-    os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
-    try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except IOError:
-        pass
+    with _history_lock:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        try:
+            with open(HISTORY_FILE, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except IOError:
+            pass
 
 
 def record_snapshot(asset: str, value: Decimal, timestamp: Optional[datetime] = None) -> None:
@@ -57,30 +67,42 @@ def record_snapshot(asset: str, value: Decimal, timestamp: Optional[datetime] =
     if timestamp is None:
         timestamp = datetime.now()
 
-    history = _load_history()
-    entries: List[Dict[str, Any]] = history.get(asset, [])
+    record_snapshots_bulk(asset, [(timestamp, value)])
 
-    date_str = timestamp.strftime("%Y-%m-%d")
-    iso_str = timestamp.isoformat()
 
-    # Update existing entry for the same day, or append new one
-    for entry in entries:
-        if entry.get("date") == date_str:
+def record_snapshots_bulk(
+    asset: str, snapshots: Iterable[Tuple[datetime, Decimal]]
+) -> None:
+    """
+    Record many (timestamp, value) data-points for *asset* in one write.
+
+    Same per-day deduplication as ``record_snapshot``, but the history file
+    is loaded and saved once for the whole batch instead of once per point.
+    """
+    with _history_lock:
+        history = _load_history()
+        entries: List[Dict[str, Any]] = history.get(asset, [])
+
+        by_date: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            by_date.setdefault(entry.get("date"), entry)
+
+        # Update existing entry for the same day, or append new one
+        for timestamp, value in snapshots:
+            date_str = timestamp.strftime("%Y-%m-%d")
+            entry = by_date.get(date_str)
+            if entry is None:
+                entry = {"date": date_str}
+                by_date[date_str] = entry
+                entries.append(entry)
             entry["value"] = str(value)
-            entry["timestamp"] = iso_str
-            break
-    else:
-        entries.append({
-            "date": date_str,
-            "value": str(value),
-            "timestamp": iso_str,
-        })
+            entry["timestamp"] = timestamp.isoformat()
 
-    # Keep entries sorted by date ascending
-    entries.sort(key=lambda e: e["date"])
+        # Keep entries sorted by date ascending
+        entries.sort(key=lambda e: e["date"])
 
-    history[asset] = entries
-    _save_history(history)
+        history[asset] = entries
+        _save_history(history)
 
 
 def get_value_at(asset: str, target_date: datetime) -> Optional[Decimal]:
@@ -107,7 +129,10 @@ def get_value_at(asset: str, target_date: datetime) -> Optional[Decimal]:
     best_entry: Optional[Dict[str, Any]] = None
     best_delta_days: Optional[int] = None
 
-    for entry in entries:
+    # Entries are kept sorted by ISO date, so only the two neighbours of the
+    # target's insertion point can be closest; the earlier one wins ties
+    idx = bisect_left(entries, target_day.isoformat(), key=itemgetter("date"))
+    for entry in entries[max(0, idx - 1):idx + 1]:
         entry_date = datetime.strptime(entry["date"], "%Y-%m-%d")
         delta_days = abs((entry_date.date() - target_day).days)
         if best_delta_days is None or delta_days < best_delta_days:
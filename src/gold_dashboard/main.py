@@ -5,58 +5,55 @@ Fetches data every 10 minutes and displays in Rich terminal UI.
 
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from rich.console import Console
 from rich.live import Live
 
 from .repositories import GoldRepository, CurrencyRepository, CryptoRepository, StockRepository, LandRepository, HistoryRepository
+from .repositories._http import close_session
 from .models import DashboardData
 from .dashboard import create_dashboard_table, create_history_table
 from .history_store import record_snapshot
+from .utils import enable_stale_while_revalidate
 
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 
 
+# (DashboardData attribute, log label, success noun, repository class)
+_SOURCES = (
+    ("gold", "Gold", "price", GoldRepository),
+    ("usd_vnd", "USD/VND", "rate", CurrencyRepository),
+    ("bitcoin", "Bitcoin", "price", CryptoRepository),
+    ("vn30", "VN30", "index", StockRepository),
+    ("land", "Land", "price", LandRepository),
+)
+
+
 def fetch_all_data() -> DashboardData:
     """
     Fetch data from all repositories with error handling.
     
-    Each repository is tried independently; if one fails, others continue.
+    Repositories are fetched concurrently since their HTTP calls are
+    independent; if one fails, others continue.
     Cache decorator ensures stale data is returned if source is unavailable.
     """
     data = DashboardData()
     
     console = Console()
     
-    try:
-        data.gold = GoldRepository().fetch()
-        console.log("[green]✓[/green] Gold price fetched")
-    except Exception as e:
-        console.log(f"[yellow]⚠[/yellow] Gold fetch failed: {e}")
-    
-    try:
-        data.usd_vnd = CurrencyRepository().fetch()
-        console.log("[green]✓[/green] USD/VND rate fetched")
-    except Exception as e:
-        console.log(f"[yellow]⚠[/yellow] USD/VND fetch failed: {e}")
-    
-    try:
-        data.bitcoin = CryptoRepository().fetch()
-        console.log("[green]✓[/green] Bitcoin price fetched")
-    except Exception as e:
-        console.log(f"[yellow]⚠[/yellow] Bitcoin fetch failed: {e}")
-    
-    try:
-        data.vn30 = StockRepository().fetch()
-        console.log("[green]✓[/green] VN30 index fetched")
-    except Exception as e:
-        console.log(f"[yellow]⚠[/yellow] VN30 fetch failed: {e}")
-
-    try:
-        data.land = LandRepository().fetch()
-        console.log("[green]✓[/green] Land price fetched")
-    except Exception as e:
-        console.log(f"[yellow]⚠[/yellow] Land fetch failed: {e}")
+    with ThreadPoolExecutor(max_workers=len(_SOURCES)) as executor:
+        futures = {
+            executor.submit(repo_cls().fetch): (attr, label, noun)
+            for attr, label, noun, repo_cls in _SOURCES
+        }
+        for future in as_completed(futures):
+            attr, label, noun = futures[future]
+            try:
+                setattr(data, attr, future.result())
+                console.log(f"[green]✓[/green] {label} {noun} fetched")
+            except Exception as e:
+                console.log(f"[yellow]⚠[/yellow] {label} fetch failed: {e}")
     
     return data
 
@@ -68,48 +65,53 @@ def main():
     console = Console()
     console.print("\n[bold cyan]Vietnam Gold Dashboard Starting...[/bold cyan]\n")
     
+    # The loop refetches every refresh, so stale cache entries may be served
+    # while they revalidate in the background
+    enable_stale_while_revalidate()
+    
     refresh_interval = 600
     
-    while True:
-        console.print(f"\n[dim]Fetching data at {datetime.now().strftime('%H:%M:%S')}...[/dim]")
-        
-        data = fetch_all_data()
-        
-        # Record current values into local history store
-        if data.gold:
-            record_snapshot("gold", data.gold.sell_price)
-        if data.usd_vnd:
-            record_snapshot("usd_vnd", data.usd_vnd.sell_rate)
-        if data.bitcoin:
-            record_snapshot("bitcoin", data.bitcoin.btc_to_vnd)
-        if data.vn30:
-            record_snapshot("vn30", data.vn30.index_value)
-        if data.land:
-            record_snapshot("land", data.land.price_per_m2)
-        
-        table = create_dashboard_table(data)
-        console.print("\n")
-        console.print(table)
-        
-        # Fetch and display historical changes
-        try:
-            history = HistoryRepository().fetch_changes(data)
-            if history:
-                console.print(create_history_table(history))
-        except Exception as e:
-            console.print(f"[dim]Historical data unavailable: {e}[/dim]")
-        
-        console.print(f"\n[dim italic]Next refresh in {refresh_interval // 60} minutes. Press Ctrl+C to exit.[/dim italic]\n")
-        
-        try:
-            time.sleep(refresh_interval)
-        except KeyboardInterrupt:
-            raise
-
-
-if __name__ == "__main__":
     try:
-        main()
+        while True:
+            console.print(f"\n[dim]Fetching data at {datetime.now().strftime('%H:%M:%S')}...[/dim]")
+            
+            data = fetch_all_data()
+            
+            # Record current values into local history store
+            if data.gold:
+                record_snapshot("gold", data.gold.sell_price)
+            if data.usd_vnd:
+                record_snapshot("usd_vnd", data.usd_vnd.sell_rate)
+            if data.bitcoin:
+                record_snapshot("bitcoin", data.bitcoin.btc_to_vnd)
+            if data.vn30:
+                record_snapshot("vn30", data.vn30.index_value)
+            if data.land:
+                record_snapshot("land", data.land.price_per_m2)
+            
+            table = create_dashboard_table(data)
+            console.print("\n")
+            console.print(table)
+            
+            # Fetch and display historical changes
+            try:
+                history = HistoryRepository().fetch_changes(data)
+                if history:
+                    console.print(create_history_table(history))
+            except Exception as e:
+                console.print(f"[dim]Historical data unavailable: {e}[/dim]")
+            
+            console.print(f"\n[dim italic]Next refresh in {refresh_interval // 60} minutes. Press Ctrl+C to exit.[/dim italic]\n")
+            
+            try:
+                time.sleep(refresh_interval)
+            except KeyboardInterrupt:
+                raise
     except KeyboardInterrupt:
-        console = Console()
         console.print("\n[bold cyan]✓ Dashboard stopped[/bold cyan]")
+    finally:
+        close_session()
+
+
+if __name__ == "__main__":
+    main()
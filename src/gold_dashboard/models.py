@@ -1,6 +1,8 @@
 """
 Data models for Vietnam Gold Dashboard using dataclasses.
 All models use Decimal for financial data to avoid floating-point errors.
+Asset snapshots are slotted and frozen; DashboardData is slotted but filled
+in field by field as fetches complete.
 """
 
 from dataclasses import dataclass, field
@@ -9,7 +11,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoldPrice:
     """Model for Vietnamese gold prices (SJC or local sources)."""
     buy_price: Decimal
@@ -23,7 +25,7 @@ class GoldPrice:
             raise ValueError("Prices must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UsdVndRate:
     """Model for USD/VND black market exchange rate."""
     sell_rate: Decimal
@@ -35,7 +37,7 @@ class UsdVndRate:
             raise ValueError("Exchange rate must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BitcoinPrice:
     """Model for Bitcoin to VND conversion rate."""
     btc_to_vnd: Decimal
@@ -47,7 +49,7 @@ class BitcoinPrice:
             raise ValueError("BTC price must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vn30Index:
     """Model for VN30 stock index."""
     index_value: Decimal
@@ -60,7 +62,7 @@ class Vn30Index:
             raise ValueError("Index value must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LandPrice:
     """Model for land price benchmark per square meter."""
     price_per_m2: Decimal
@@ -74,7 +76,7 @@ class LandPrice:
             raise ValueError("Land price must be positive")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GasolinePrice:
     """Model for Vietnam retail gasoline prices (government-regulated)."""
     ron95_price: Decimal          # RON 95-III price, VND/liter
@@ -88,7 +90,7 @@ class GasolinePrice:
             raise ValueError("Gasoline price must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardData:
     """Aggregated model for all dashboard data."""
     gold: Optional[GoldPrice] = None
@@ -1,16 +1,34 @@
 """
 Repository package for Vietnam Gold Dashboard.
 Implements the Repository Pattern for data fetching.
+
+Concrete repositories are imported lazily on first attribute access
+(PEP 562), so a caller only loads the scraping stack it actually uses.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .base import Repository
-from .gold_repo import GoldRepository
-from .currency_repo import CurrencyRepository
-from .crypto_repo import CryptoRepository
-from .stock_repo import StockRepository
-from .land_repo import LandRepository
-from .gasoline_repo import GasolineRepository
-from .history_repo import HistoryRepository
+
+if TYPE_CHECKING:
+    from .gold_repo import GoldRepository
+    from .currency_repo import CurrencyRepository
+    from .crypto_repo import CryptoRepository
+    from .stock_repo import StockRepository
+    from .land_repo import LandRepository
+    from .gasoline_repo import GasolineRepository
+    from .history_repo import HistoryRepository
+
+_LAZY_REPOSITORIES = {
+    'GoldRepository': '.gold_repo',
+    'CurrencyRepository': '.currency_repo',
+    'CryptoRepository': '.crypto_repo',
+    'StockRepository': '.stock_repo',
+    'LandRepository': '.land_repo',
+    'GasolineRepository': '.gasoline_repo',
+    'HistoryRepository': '.history_repo',
+}
 
 __all__ = [
     'Repository',
@@ -22,3 +40,16 @@ __all__ = [
     'GasolineRepository',
     'HistoryRepository',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_REPOSITORIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
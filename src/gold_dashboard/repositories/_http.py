@@ -0,0 +1,108 @@
+"""
+Shared HTTP session for Vietnam Gold Dashboard repositories.
+Reuses pooled keep-alive connections across scrapers instead of opening a
+fresh TCP+TLS connection on every request.
+
+The session stays on requests rather than an HTTP/2 client: every source
+is a different host, so multiplexing would not share connections between
+scrapers, and urllib3's thread-safe pool already gives each concurrent
+fetch its own keep-alive socket per host.
+"""
+
+import time
+from typing import Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import HEADERS, MAX_RESPONSE_BYTES, REQUEST_TIMEOUT
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a session with default headers, connection pooling and retries.
+
+    Only 502/503/504 answers are retried.  Connect errors and read timeouts
+    are not: each retry would wait out another full timeout, multiplying
+    every scraper's worst case and overrunning fallback-chain deadlines.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+# Per-request headers for the JSON APIs (Open ER, VPS, CoinGecko): drop the
+# browser-navigation defaults (HTML Accept, Sec-Fetch-*, ...) that SESSION
+# sends and go out with requests' plain defaults plus our User-Agent only
+API_HEADERS: Dict[str, Optional[str]] = {
+    **{name: None for name in HEADERS},
+    **requests.utils.default_headers(),
+    "User-Agent": HEADERS["User-Agent"],
+}
+
+
+def close_session() -> None:
+    """Release the pooled keep-alive connections held by SESSION."""
+    SESSION.close()
+
+
+def iter_capped(
+    response: requests.Response, max_bytes: int = MAX_RESPONSE_BYTES
+) -> Iterator[bytes]:
+    """
+    Yield a streamed response body chunk by chunk, enforcing a size cap.
+
+    Raises:
+        ValueError: If the body grows beyond max_bytes
+    """
+    received = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"Response body exceeds {max_bytes} bytes")
+        yield chunk
+
+
+def read_capped(
+    response: requests.Response, max_bytes: int = MAX_RESPONSE_BYTES
+) -> bytes:
+    """Read a streamed response body, raising ValueError beyond max_bytes."""
+    return b"".join(iter_capped(response, max_bytes))
+
+
+def timeout_until(deadline: float) -> float:
+    """
+    Per-request timeout that still ends before a time.monotonic() deadline.
+
+    This caps the connect/read timeout handed to requests.  SESSION does not
+    retry connect errors or read timeouts, so a hung source gives up at the
+    deadline; only a body that keeps trickling bytes (the read timeout is per
+    socket read) or 502/503/504 status retries can run past it.
+
+    Raises:
+        requests.exceptions.Timeout: If the deadline has already passed, so
+            fallback chains treat it like any other failed request
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.exceptions.Timeout("Fallback chain time budget exhausted")
+    return min(REQUEST_TIMEOUT, remaining)
@@ -3,17 +3,55 @@ Cryptocurrency repository for Vietnam Gold Dashboard.
 Fetches Bitcoin to VND conversion rate from CoinMarketCap with CoinGecko fallback.
 """
 
+import re
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 
 from .base import Repository
+from ._http import SESSION, iter_capped
 from ..models import BitcoinPrice
-from ..config import COINMARKETCAP_BTC_VND_URL, COINGECKO_API_URL, HEADERS, REQUEST_TIMEOUT
+from ..config import COINMARKETCAP_BTC_VND_URL, COINGECKO_API_URL, REQUEST_TIMEOUT
 from ..utils import cached, sanitize_vn_number
 
+# Plausible BTC/VND range for scraped values
+_BTC_LO = Decimal('1000000000')
+_BTC_HI = Decimal('5000000000')
+
+# Thousands-grouped numbers such as 2.512.345.678 or 26,450.00
+_VN_NUM_PATTERN = r'\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?'
+_VN_NUM = re.compile(_VN_NUM_PATTERN)
+
+# At least ten integer digits, grouped by '.', ',' or whitespace (as
+# sanitize_vn_number accepts) or not at all: anything shorter is below _BTC_LO
+_BTC_SIZED_PATTERN = r'\d{1,3}(?:[.,\s]\d{3}){3}|\d{10}'
+
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+_VISIBLE = "not(ancestor::script or ancestor::style)"
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# span/div/p elements whose class mentions price/value/amount (any case) and
+# whose text holds a BTC-sized number, filtered in one tree traversal
+_PRICE_XPATH = etree.XPath(
+    "//*[self::span or self::div or self::p][" + " or ".join(
+        f"contains({_LOWER_CLASS}, '{keyword}')"
+        for keyword in ("price", "value", "amount")
+    ) + f"][re:test(., '{_BTC_SIZED_PATTERN}')]",
+    namespaces=_XPATH_NS,
+)
+
+# Visible text nodes, equivalent to BeautifulSoup's stripped_strings
+_TEXT_XPATH = etree.XPath(f"//text()[{_VISIBLE}]")
+
+# Visible text nodes containing at least one grouped number
+_NUMBER_TEXT_XPATH = etree.XPath(
+    f"//text()[{_VISIBLE}][re:test(., '{_VN_NUM_PATTERN}')]",
+    namespaces=_XPATH_NS,
+)
+
 
 class CryptoRepository(Repository[BitcoinPrice]):
     """
@@ -32,15 +70,19 @@ class CryptoRepository(Repository[BitcoinPrice]):
             BitcoinPrice model with validated data or fallback approximate rate
         """
         try:
-            response = requests.get(
+            with SESSION.get(
                 COINMARKETCAP_BTC_VND_URL,
-                headers=HEADERS,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
+                timeout=REQUEST_TIMEOUT,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                # Parse while the body streams in instead of buffering it first
+                parser = lxml.html.HTMLParser()
+                for chunk in iter_capped(response):
+                    parser.feed(chunk)
+                root = parser.close()
             
-            soup = BeautifulSoup(response.content, 'lxml')
-            btc_to_vnd = self._extract_btc_rate(soup)
+            btc_to_vnd = self._extract_btc_rate(root)
             
             if btc_to_vnd:
                 return BitcoinPrice(
@@ -48,7 +90,7 @@ class CryptoRepository(Repository[BitcoinPrice]):
                     source="CoinMarketCap",
                     timestamp=datetime.now()
                 )
-        except (requests.exceptions.RequestException, ValueError):
+        except (requests.exceptions.RequestException, ValueError, etree.LxmlError):
             pass
         
         try:
@@ -65,19 +107,19 @@ class CryptoRepository(Repository[BitcoinPrice]):
     
     def _fetch_from_coingecko(self) -> BitcoinPrice:
         """Fetch BTC/VND rate from CoinGecko API as fallback."""
-        response = requests.get(
+        response = SESSION.get(
             COINGECKO_API_URL,
-            headers=HEADERS,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
         
-        data = response.json()
+        # Decode fractional values straight to Decimal, skipping float/str round trips
+        data = response.json(parse_float=Decimal)
         
         if 'bitcoin' not in data or 'vnd' not in data['bitcoin']:
             raise ValueError("Failed to parse BTC/VND rate from CoinGecko API")
         
-        btc_to_vnd = Decimal(str(data['bitcoin']['vnd']))
+        btc_to_vnd = Decimal(data['bitcoin']['vnd'])
         
         return BitcoinPrice(
             btc_to_vnd=btc_to_vnd,
@@ -85,37 +127,33 @@ class CryptoRepository(Repository[BitcoinPrice]):
             timestamp=datetime.now()
         )
     
-    def _extract_btc_rate(self, soup: BeautifulSoup) -> Optional[Decimal]:
+    def _extract_btc_rate(self, root: lxml.html.HtmlElement) -> Optional[Decimal]:
         """
         Extract BTC to VND rate from CoinMarketCap HTML.
         
         Targets conversion rate text and applies number sanitization.
+        Candidate filtering (class names, number shape) happens inside the
+        compiled XPath queries so Python only sanitizes plausible hits.
         """
-        price_elements = soup.find_all(['span', 'div', 'p'], class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ['price', 'value', 'amount']
-        ))
-        
-        for elem in price_elements:
-            elem_text = elem.get_text(strip=True)
+        for elem in _PRICE_XPATH(root):
+            elem_text = elem.text_content().strip()
             rate = sanitize_vn_number(elem_text)
-            if rate and 1000000000 < rate < 5000000000:
+            if rate and _BTC_LO < rate < _BTC_HI:
                 return rate
         
-        text = soup.get_text()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [text.strip() for text in _TEXT_XPATH(root) if text.strip()]
         
         for i, line in enumerate(lines):
             if any(keyword in line for keyword in ['VND', 'vnd', 'Bitcoin', 'BTC']):
                 for j in range(max(0, i-3), min(len(lines), i+5)):
                     rate = sanitize_vn_number(lines[j])
-                    if rate and 1000000000 < rate < 5000000000:
+                    if rate and _BTC_LO < rate < _BTC_HI:
                         return rate
         
-        import re
-        numbers = re.findall(r'\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?', text)
-        for num_str in numbers:
-            rate = sanitize_vn_number(num_str)
-            if rate and 1000000000 < rate < 5000000000:
-                return rate
+        for text in _NUMBER_TEXT_XPATH(root):
+            for match in _VN_NUM.finditer(text):
+                rate = sanitize_vn_number(match.group())
+                if rate and _BTC_LO < rate < _BTC_HI:
+                    return rate
         
         return None
@@ -3,17 +3,57 @@ Currency exchange repository for Vietnam Gold Dashboard.
 Fetches USD/VND black market rates from EGCurrency with fallback.
 """
 
+import re
+import time
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 
 from .base import Repository
+from ._http import API_HEADERS, SESSION, read_capped, timeout_until
 from ..models import UsdVndRate
-from ..config import EGCURRENCY_URL, CHOGIA_AJAX_URL, HEADERS, REQUEST_TIMEOUT, OPEN_ER_API_URL, BLACK_MARKET_PREMIUM
+from ..config import (
+    EGCURRENCY_URL,
+    CHOGIA_AJAX_URL,
+    OPEN_ER_API_URL,
+    BLACK_MARKET_PREMIUM,
+    FALLBACK_CHAIN_BUDGET,
+    REQUEST_TIMEOUT,
+)
 from ..utils import cached, sanitize_vn_number
 
+# Plausible USD/VND ranges: API values and numbers scraped from page text
+_USD_LO = Decimal('20000')
+_USD_API_HI = Decimal('35000')
+_USD_SCRAPE_HI = Decimal('30000')
+_CENT = Decimal('0.01')
+
+# Thousands-grouped numbers such as 2.512.345.678 or 26,450.00
+_VN_NUM = re.compile(r'\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?')
+
+# Words _extract_sell_rate keys on (sell labels, price/rate classes); block
+# and error pages carry none of them and are not worth parsing
+_RATE_MARKERS = (b'sell', 'bán'.encode('utf-8'), b'price', b'rate')
+
+# Sell labels (English and Vietnamese) on EGCurrency rate lines
+_SELL_RE = re.compile(r'sell|bán', re.IGNORECASE)
+
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# div/span/td/p elements whose class mentions price/rate/sell (any case)
+_PRICE_XPATH = etree.XPath(
+    "//*[self::div or self::span or self::td or self::p][" + " or ".join(
+        f"contains({_LOWER_CLASS}, '{keyword}')"
+        for keyword in ("price", "rate", "sell")
+    ) + "]"
+)
+
+# Visible text nodes, equivalent to BeautifulSoup's stripped_strings
+_TEXT_XPATH = etree.XPath("//text()[not(ancestor::script or ancestor::style)]")
+
 
 class CurrencyRepository(Repository[UsdVndRate]):
     """
@@ -22,29 +62,44 @@ class CurrencyRepository(Repository[UsdVndRate]):
     Source chain: chogia.vn → EGCurrency → Open ExchangeRate API → Hardcoded fallback
     """
     
-    @cached
+    @cached(stale_ttl=3600)
     def fetch(self) -> UsdVndRate:
         """
         Fetch current USD/VND black market rate with fallback.
         
+        The scraped sources (chogia.vn, EGCurrency) share one
+        FALLBACK_CHAIN_BUDGET deadline, so a slow day cannot stack a full
+        timeout per scraper.  Open ER API, the last real source, always gets
+        its full REQUEST_TIMEOUT so an unreachable chogia.vn (the usual case
+        on CI) never starves it into the hardcoded rate.
+        
         Returns:
             UsdVndRate model with validated data or fallback approximate rate
         """
+        deadline = time.monotonic() + FALLBACK_CHAIN_BUDGET
+        
         try:
-            return self._fetch_from_chogia()
+            return self._fetch_from_chogia(deadline)
         except (requests.exceptions.RequestException, ValueError, KeyError) as e:
             print(f"chogia.vn fetch failed: {e}")
         
         try:
-            response = requests.get(
+            with SESSION.get(
                 EGCURRENCY_URL,
-                headers=HEADERS,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
+                timeout=timeout_until(deadline),
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                body = read_capped(response)
             
-            soup = BeautifulSoup(response.content, 'lxml')
-            sell_rate = self._extract_sell_rate(soup)
+            lowered = body.lower()
+            if not any(marker in lowered for marker in _RATE_MARKERS):
+                raise ValueError("EGCurrency response has no rate table markers")
+            
+            root = lxml.html.document_fromstring(
+                body, parser=lxml.html.HTMLParser(encoding='utf-8')
+            )
+            sell_rate = self._extract_sell_rate(root)
             
             if sell_rate:
                 return UsdVndRate(
@@ -52,7 +107,7 @@ class CurrencyRepository(Repository[UsdVndRate]):
                     source="EGCurrency",
                     timestamp=datetime.now()
                 )
-        except (requests.exceptions.RequestException, ValueError) as e:
+        except (requests.exceptions.RequestException, ValueError, etree.LxmlError) as e:
             print(f"EGCurrency fetch failed: {e}")
         
         # 3. Try Open ExchangeRate API (international, always works)
@@ -68,24 +123,21 @@ class CurrencyRepository(Repository[UsdVndRate]):
             timestamp=datetime.now()
         )
     
-    def _fetch_from_chogia(self) -> UsdVndRate:
+    def _fetch_from_chogia(self, deadline: float) -> UsdVndRate:
         """
         Fetch USD black market rate from chogia.vn AJAX endpoint (primary source).
         
         POST to WordPress admin-ajax with action=load_gia_ngoai_te_cho_do_thi&ma=USD
         Returns JSON with daily rates; we take the latest entry.
         """
-        response = requests.post(
+        response = SESSION.post(
             CHOGIA_AJAX_URL,
-            headers={
-                **HEADERS,
-                'Content-Type': 'application/x-www-form-urlencoded',
-            },
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
             data={
                 'action': 'load_gia_ngoai_te_cho_do_thi',
                 'ma': 'USD'
             },
-            timeout=REQUEST_TIMEOUT
+            timeout=timeout_until(deadline)
         )
         response.raise_for_status()
         
@@ -103,7 +155,7 @@ class CurrencyRepository(Repository[UsdVndRate]):
         sell_rate_str = latest.get('gia_ban', '')
         sell_rate = Decimal(sell_rate_str)
         
-        if sell_rate < 20000 or sell_rate > 35000:
+        if sell_rate < _USD_LO or sell_rate > _USD_API_HI:
             raise ValueError(f"USD rate {sell_rate} outside expected range")
         
         return UsdVndRate(
@@ -119,9 +171,9 @@ class CurrencyRepository(Repository[UsdVndRate]):
         Returns the official bank rate (not black market), but is reliable
         from any IP worldwide. Better than showing a stale hardcoded fallback.
         """
-        response = requests.get(
+        response = SESSION.get(
             OPEN_ER_API_URL,
-            headers={"User-Agent": HEADERS["User-Agent"]},
+            headers=API_HEADERS,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
@@ -137,11 +189,11 @@ class CurrencyRepository(Repository[UsdVndRate]):
         
         official_rate = Decimal(str(vnd_rate))
         
-        if official_rate < 20000 or official_rate > 35000:
+        if official_rate < _USD_LO or official_rate > _USD_API_HI:
             raise ValueError(f"USD rate {official_rate} outside expected range")
         
         # Apply black market premium since the official bank rate is lower
-        sell_rate = (official_rate * BLACK_MARKET_PREMIUM).quantize(Decimal("0.01"))
+        sell_rate = (official_rate * BLACK_MARKET_PREMIUM).quantize(_CENT)
         
         return UsdVndRate(
             sell_rate=sell_rate,
@@ -149,37 +201,30 @@ class CurrencyRepository(Repository[UsdVndRate]):
             timestamp=datetime.now()
         )
 
-    def _extract_sell_rate(self, soup: BeautifulSoup) -> Optional[Decimal]:
+    def _extract_sell_rate(self, root: lxml.html.HtmlElement) -> Optional[Decimal]:
         """
         Extract sell rate from EGCurrency HTML.
         
         Targets "Sell Price" text and applies Vietnamese number sanitization.
         """
-        text = soup.get_text()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [text.strip() for text in _TEXT_XPATH(root) if text.strip()]
         
         for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in ['sell', 'bán', 'selling', 'sell price']):
+            if _SELL_RE.search(line):
                 for j in range(i, min(len(lines), i + 5)):
                     rate = sanitize_vn_number(lines[j])
-                    if rate and 20000 < rate < 30000:
+                    if rate and _USD_LO < rate < _USD_SCRAPE_HI:
                         return rate
         
-        price_elements = soup.find_all(['div', 'span', 'td', 'p'], class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ['price', 'rate', 'sell']
-        ))
-        
-        for elem in price_elements:
-            elem_text = elem.get_text(strip=True)
-            rate = sanitize_vn_number(elem_text)
-            if rate and 20000 < rate < 30000:
+        for elem in _PRICE_XPATH(root):
+            rate = sanitize_vn_number(elem.text_content().strip())
+            if rate and _USD_LO < rate < _USD_SCRAPE_HI:
                 return rate
         
-        import re
-        numbers = re.findall(r'\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?', text)
-        for num_str in numbers:
-            rate = sanitize_vn_number(num_str)
-            if rate and 20000 < rate < 30000:
-                return rate
+        for line in lines:
+            for match in _VN_NUM.finditer(line):
+                rate = sanitize_vn_number(match.group())
+                if rate and _USD_LO < rate < _USD_SCRAPE_HI:
+                    return rate
         
         return None
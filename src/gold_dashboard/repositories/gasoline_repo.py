@@ -13,6 +13,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from .base import Repository
+from ._http import SESSION
 from ..config import (
     GASOLINE_FALLBACK_E5_RON92_PRICE,
     GASOLINE_MAX_AGE_DAYS,
@@ -21,7 +22,6 @@ from ..config import (
     GASOLINE_MAX_VALID_VND,
     GASOLINE_MIN_VALID_VND,
     GASOLINE_UNIT,
-    HEADERS,
     PETROLIMEX_URL,
     PVOIL_URL,
     REQUEST_TIMEOUT,
@@ -130,7 +130,7 @@ class GasolineRepository(Repository[GasolinePrice]):
         validate against valid range, persist result, and return GasolinePrice.
         Raises ValueError if no valid RON 95-III price found.
         Raises requests.exceptions.RequestException on network failure."""
-        response = requests.get(XANGDAU_URL, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        response = SESSION.get(XANGDAU_URL, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
@@ -156,9 +156,7 @@ class GasolineRepository(Repository[GasolinePrice]):
         and E5 RON 92 prices, validate, persist, and return GasolinePrice.
         Raises ValueError if no valid RON 95-III price found.
         Raises requests.exceptions.RequestException on network failure (geo-blocked outside VN)."""
-        response = requests.get(
-            PETROLIMEX_URL, headers=HEADERS, timeout=REQUEST_TIMEOUT
-        )
+        response = SESSION.get(PETROLIMEX_URL, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
@@ -188,9 +186,7 @@ class GasolineRepository(Repository[GasolinePrice]):
         and E5 RON 92 prices, validate, persist, and return GasolinePrice.
         Raises ValueError if no valid RON 95-III price found.
         Raises requests.exceptions.RequestException on network failure."""
-        response = requests.get(
-            PVOIL_URL, headers=HEADERS, timeout=REQUEST_TIMEOUT
-        )
+        response = SESSION.get(PVOIL_URL, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
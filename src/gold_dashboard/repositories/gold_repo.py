@@ -1,35 +1,124 @@
 """
 Gold price repository for Vietnam Gold Dashboard.
-Fetches SJC gold prices with Mi Hồng fallback.
+Fetches SJC gold prices from DOJI with Mi Hồng fallback.
 """
 
+import json
+import re
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional
-from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
 
 from .base import Repository
+from ._http import SESSION, iter_capped, read_capped
 from ..models import GoldPrice
-from ..config import SJC_URL, MIHONG_URL, DOJI_API_URL, HEADERS, REQUEST_TIMEOUT
+from ..config import MIHONG_URL, DOJI_API_URL, GOLD_LAST_GOOD_SCRAPE_FILE, REQUEST_TIMEOUT
 from ..utils import cached, sanitize_vn_number
 
+# Plausible VND/tael range for Mi Hồng prices (upper bound for text matches)
+_GOLD_LO = Decimal('1000000')
+_GOLD_TEXT_HI = Decimal('100000000')
+
+# DOJI quotes prices in units of 10,000 VND; smaller raw values are bogus
+_DOJI_UNIT = Decimal('10000')
+_DOJI_MIN_RAW = Decimal('1000')
+
+# (log label, fetch method) in priority order
+_SOURCES = (
+    ("DOJI", "_fetch_from_doji"),
+    ("Mi Hồng", "_fetch_from_mihong"),
+)
+
+# Conditional-request headers and the price they validate, per source;
+# a 304 reuses the stored price without transferring or parsing a body
+_revalidation: Dict[str, Tuple[Dict[str, str], GoldPrice]] = {}
+
+# Buy/sell labels (English and Vietnamese) on Mi Hồng price lines
+_BUY_RE = re.compile(r'buy|mua', re.IGNORECASE)
+_SELL_RE = re.compile(r'sell|bán', re.IGNORECASE)
+
+# Compiled once at import (the XPath equivalents of CSS 'table tr' / 'td, th')
+_ROW_XPATH = etree.XPath("//table//tr")
+_CELL_XPATH = etree.XPath(".//td | .//th")
+
+# Visible text nodes, equivalent to BeautifulSoup's stripped_strings
+_TEXT_XPATH = etree.XPath("//text()[not(ancestor::script or ancestor::style)]")
+
+
+def _validators(response: requests.Response) -> Dict[str, str]:
+    """Conditional-request headers derived from a response's ETag/Last-Modified."""
+    headers = {}
+    etag = response.headers.get('ETag')
+    if etag:
+        headers['If-None-Match'] = etag
+    last_modified = response.headers.get('Last-Modified')
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _iter_streamed_elements(
+    response: requests.Response, tags: Tuple[str, ...]
+) -> Iterator[etree._Element]:
+    """Yield matching XML elements as their end tags arrive in a streamed body."""
+    parser = etree.XMLPullParser(events=('end',), tag=tags)
+    for chunk in iter_capped(response):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            yield elem
+    parser.close()
+    for _, elem in parser.read_events():
+        yield elem
+
+
+def _conditional_headers(source: str) -> Dict[str, str]:
+    """If-None-Match/If-Modified-Since headers for the source's stored price."""
+    entry = _revalidation.get(source)
+    return entry[0] if entry else {}
+
+
+def _remember(source: str, validators: Dict[str, str], price: GoldPrice) -> GoldPrice:
+    """Store the validators for a freshly parsed price and return the price."""
+    if validators:
+        _revalidation[source] = (validators, price)
+    else:
+        _revalidation.pop(source, None)
+    return price
+
+
+def _not_modified(source: str) -> GoldPrice:
+    """Re-serve the stored price for a source that answered 304."""
+    entry = _revalidation.get(source)
+    if entry is None:
+        raise ValueError(f"{source} answered 304 without a stored price")
+    return replace(entry[1], timestamp=datetime.now())
+
 
 class GoldRepository(Repository[GoldPrice]):
     """
     Repository for Vietnamese gold prices.
     
     Strategy:
-    1. Try SJC primary source with strict headers
-    2. If SJC fails (timeout, 404, blocked), fallback to Mi Hồng
-    3. If both fail, return approximate market data
-    4. Cache results to avoid rapid retries
+    1. Request DOJI XML API (primary) and Mi Hồng concurrently
+    2. If DOJI fails (timeout, 404, blocked), fallback to Mi Hồng
+    3. If both fail, return the persisted last-good scrape
+    4. Without one, return approximate market data
+    5. Cache results to avoid rapid retries
     """
     
     @cached
     def fetch(self) -> GoldPrice:
         """
-        Fetch current gold price from DOJI API, Mi Hồng, or SJC.
+        Fetch current gold price from DOJI API or Mi Hồng.
+        
+        SJC is not in the chain: its prices are JS-rendered, so the page
+        never yields a parsable price.
         
         Returns:
             GoldPrice model with validated data
@@ -37,20 +126,32 @@ class GoldRepository(Repository[GoldPrice]):
         Note:
             Returns fallback data if all sources fail to ensure UI stability
         """
+        # Both sources are requested at once so a slow DOJI no longer delays
+        # Mi Hồng; results are still taken in priority order
+        executor = ThreadPoolExecutor(max_workers=len(_SOURCES))
         try:
-            return self._fetch_from_doji()
-        except (requests.exceptions.RequestException, ValueError) as e:
-            print(f"DOJI fetch failed: {e}")
-        
-        try:
-            return self._fetch_from_mihong()
-        except (requests.exceptions.RequestException, ValueError) as e:
-            print(f"Mi Hồng fetch failed: {e}")
+            futures = [
+                (label, executor.submit(getattr(self, method)))
+                for label, method in _SOURCES
+            ]
+            for label, future in futures:
+                try:
+                    result = future.result()
+                    self._persist_last_good_scrape(result)
+                    return result
+                except (requests.exceptions.RequestException, ValueError, etree.LxmlError) as e:
+                    print(f"{label} fetch failed: {e}")
+        finally:
+            # Don't wait on a lower-priority source once a result is in
+            executor.shutdown(wait=False, cancel_futures=True)
         
         try:
-            return self._fetch_from_sjc()
-        except (requests.exceptions.RequestException, ValueError) as e:
-            print(f"SJC fetch failed: {e}")
+            result = self._load_last_good_scrape()
+            if result is not None:
+                print(f"Using persisted last-good gold price from {result.source}")
+                return result
+        except Exception as e:
+            print(f"Failed to load persisted gold price: {e}")
         
         return GoldPrice(
             buy_price=Decimal('175400000'),
@@ -67,178 +168,224 @@ class GoldRepository(Repository[GoldPrice]):
         DOJI returns XML with prices in units of 10,000 VND.
         E.g., Sell='17,540' means 175,400,000 VND/tael.
         """
-        response = requests.get(
-            DOJI_API_URL,
-            headers=HEADERS,
-            timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
+        # Rows are parsed as chunks arrive: remember the first DGPlist HCM
+        # row and stop at the first HCM retail row, which is preferred, so
+        # the rest of the body is never downloaded
+        retail_row: Optional[Tuple[str, str]] = None
+        hcm_row: Optional[Tuple[str, str]] = None
+        found_list = False
         
-        soup = BeautifulSoup(response.content, 'lxml-xml')
+        with SESSION.get(
+            DOJI_API_URL,
+            headers=_conditional_headers("DOJI"),
+            timeout=REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            if response.status_code == 304:
+                return _not_modified("DOJI")
+            response.raise_for_status()
+            validators = _validators(response)
+            
+            for elem in _iter_streamed_elements(response, ('Row', 'DGPlist')):
+                if elem.tag == 'DGPlist':
+                    found_list = True
+                    break
+                if elem.getparent().tag != 'DGPlist':
+                    elem.clear()
+                    continue
+                found_list = True
+                
+                name = elem.get('Name', '')
+                if 'HCM' in name:
+                    prices = (elem.get('Sell', ''), elem.get('Buy', ''))
+                    if hcm_row is None:
+                        hcm_row = prices
+                    if 'lẻ' in name.lower():
+                        retail_row = prices
+                        break
+                elem.clear()
         
-        dgp_list = soup.find('DGPlist')
-        if not dgp_list:
+        if not found_list:
             raise ValueError("No DGPlist found in DOJI response")
         
-        buy_price = None
-        sell_price = None
+        buy_price: Optional[Decimal] = None
+        sell_price: Optional[Decimal] = None
         
-        for row in dgp_list.find_all('Row'):
-            name = row.get('Name', '')
-            if 'HCM' in name and 'lẻ' in name.lower():
-                sell_str = row.get('Sell', '').replace(',', '')
-                buy_str = row.get('Buy', '').replace(',', '')
+        for row in (retail_row, hcm_row):
+            if row is None:
+                continue
+            sell_str, buy_str = (value.replace(',', '') for value in row)
+            
+            try:
+                sell_val = Decimal(sell_str)
+                buy_val = Decimal(buy_str)
                 
-                try:
-                    sell_val = Decimal(sell_str)
-                    buy_val = Decimal(buy_str)
-                    
-                    if sell_val > 1000:
-                        sell_price = sell_val * Decimal('10000')
-                    if buy_val > 1000:
-                        buy_price = buy_val * Decimal('10000')
-                except:
-                    pass
+                if sell_val > _DOJI_MIN_RAW:
+                    sell_price = sell_val * _DOJI_UNIT
+                if buy_val > _DOJI_MIN_RAW:
+                    buy_price = buy_val * _DOJI_UNIT
+            except InvalidOperation:
+                pass
+            
+            if buy_price and sell_price:
                 break
         
-        if not buy_price or not sell_price:
-            for row in dgp_list.find_all('Row'):
-                name = row.get('Name', '')
-                if 'HCM' in name:
-                    sell_str = row.get('Sell', '').replace(',', '')
-                    buy_str = row.get('Buy', '').replace(',', '')
-                    
-                    try:
-                        sell_val = Decimal(sell_str)
-                        buy_val = Decimal(buy_str)
-                        
-                        if sell_val > 1000:
-                            sell_price = sell_val * Decimal('10000')
-                        if buy_val > 1000:
-                            buy_price = buy_val * Decimal('10000')
-                    except:
-                        pass
-                    break
-        
         if not buy_price or not sell_price:
             raise ValueError("Failed to parse DOJI gold prices")
         
-        return GoldPrice(
+        return _remember("DOJI", validators, GoldPrice(
             buy_price=buy_price,
             sell_price=sell_price,
             unit="VND/tael",
             source="DOJI",
             timestamp=datetime.now()
-        )
-    
-    def _fetch_from_sjc(self) -> GoldPrice:
-        """Fetch gold price from SJC official site."""
-        response = requests.get(
-            SJC_URL,
-            headers=HEADERS,
-            timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        buy_price = self._extract_sjc_price(soup, 'buy')
-        sell_price = self._extract_sjc_price(soup, 'sell')
-        
-        if not buy_price or not sell_price:
-            raise ValueError("Failed to parse SJC gold prices")
-        
-        return GoldPrice(
-            buy_price=buy_price,
-            sell_price=sell_price,
-            unit="VND/tael",
-            source="SJC",
-            timestamp=datetime.now()
-        )
+        ))
     
     def _fetch_from_mihong(self) -> GoldPrice:
         """Fetch gold price from Mi Hồng fallback source."""
-        response = requests.get(
+        with SESSION.get(
             MIHONG_URL,
-            headers=HEADERS,
+            headers=_conditional_headers("Mi Hồng"),
             timeout=REQUEST_TIMEOUT,
-            verify=False
-        )
-        response.raise_for_status()
+            verify=False,
+            stream=True
+        ) as response:
+            if response.status_code == 304:
+                return _not_modified("Mi Hồng")
+            response.raise_for_status()
+            validators = _validators(response)
+            body = read_capped(response)
         
-        soup = BeautifulSoup(response.content, 'lxml')
+        # Mi Hồng serves UTF-8; don't let libxml2 guess when no charset is declared
+        root = lxml.html.document_fromstring(
+            body, parser=lxml.html.HTMLParser(encoding='utf-8')
+        )
         
-        buy_price = self._extract_mihong_price(soup, 'buy')
-        sell_price = self._extract_mihong_price(soup, 'sell')
+        buy_price, sell_price = self._extract_mihong_prices(root)
         
         if not buy_price or not sell_price:
             raise ValueError("Failed to parse Mi Hồng gold prices")
         
-        return GoldPrice(
+        return _remember("Mi Hồng", validators, GoldPrice(
             buy_price=buy_price,
             sell_price=sell_price,
             unit="VND/tael",
             source="Mi Hồng",
             timestamp=datetime.now()
-        )
+        ))
     
-    def _extract_sjc_price(self, soup: BeautifulSoup, price_type: str) -> Optional[float]:
+    def _extract_mihong_prices(
+        self, root: lxml.html.HtmlElement
+    ) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         """
-        Extract buy/sell price from SJC HTML.
-        SJC loads prices via JavaScript, so table is empty in initial HTML.
-        Return None to trigger Mi Hồng fallback.
-        """
-        return None
-    
-    def _extract_mihong_price(self, soup: BeautifulSoup, price_type: str) -> Optional[float]:
-        """
-        Extract buy/sell price from Mi Hồng HTML.
+        Extract (buy, sell) prices from Mi Hồng HTML in a single traversal.
         Look for price sections with SJC gold type.
         """
+        buy_price: Optional[Decimal] = None
+        sell_price: Optional[Decimal] = None
+        
         # Try table-based extraction first
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                cell_texts = [cell.get_text(strip=True) for cell in cells]
-                
-                # Look for row containing SJC
-                if any('SJC' in text for text in cell_texts):
-                    # Try to find buy/sell prices in this row
-                    for i, text in enumerate(cell_texts):
-                        if 'buy' in price_type.lower():
-                            # Buy price typically in column 1 or 2
-                            if i > 0 and i < len(cell_texts):
-                                price_val = sanitize_vn_number(cell_texts[i])
-                                if price_val and price_val > 1000000:
-                                    return price_val
-                        elif 'sell' in price_type.lower():
-                            # Sell price typically in column 2 or 3
-                            if i > 1 and i < len(cell_texts):
-                                price_val = sanitize_vn_number(cell_texts[i])
-                                if price_val and price_val > 1000000:
-                                    return price_val
-        
-        # Fallback to text-based extraction
-        text = soup.get_text()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        for i, line in enumerate(lines):
-            if 'SJC' in line:
-                # Look ahead for buy/sell indicators and prices
-                for j in range(i, min(len(lines), i+15)):
-                    candidate = lines[j]
-                    
-                    # Check for buy/sell keywords (English and Vietnamese)
-                    is_buy_line = any(keyword in candidate.lower() for keyword in ['buy', 'mua', 'buying'])
-                    is_sell_line = any(keyword in candidate.lower() for keyword in ['sell', 'bán', 'selling'])
-                    
-                    if (price_type.lower() == 'buy' and is_buy_line) or (price_type.lower() == 'sell' and is_sell_line):
-                        # Look for price in this line and next few lines
-                        for k in range(j, min(len(lines), j+5)):
-                            price_val = sanitize_vn_number(lines[k])
-                            if price_val and price_val > 1000000 and price_val < 100000000:
-                                return price_val
-        
-        return None
+        for row in _ROW_XPATH(root):
+            # Cheap whole-row check before splitting the row into cells
+            if 'SJC' not in row.text_content():
+                continue
+            
+            cell_texts = [cell.text_content().strip() for cell in _CELL_XPATH(row)]
+            
+            # Look for row containing SJC
+            if not any('SJC' in text for text in cell_texts):
+                continue
+            
+            # Buy price typically in column 1 or 2, sell in column 2 or 3
+            for i, text in enumerate(cell_texts):
+                if i == 0:
+                    continue
+                price_val = sanitize_vn_number(text)
+                if not price_val or price_val <= _GOLD_LO:
+                    continue
+                if buy_price is None:
+                    buy_price = price_val
+                if sell_price is None and i > 1:
+                    sell_price = price_val
+                if buy_price is not None and sell_price is not None:
+                    return buy_price, sell_price
+        
+        # Fallback to text-based extraction for whichever price is missing.
+        # A single sweep: lines within 15 of the latest SJC line are
+        # candidates, and each line's price is parsed at most once.
+        lines = [text.strip() for text in _TEXT_XPATH(root) if text.strip()]
+        prices: List[Optional[Decimal]] = [None] * len(lines)
+        parsed = [False] * len(lines)
+        last_sjc: Optional[int] = None
+        
+        for j, candidate in enumerate(lines):
+            if 'SJC' in candidate:
+                last_sjc = j
+            if last_sjc is None or j - last_sjc >= 15:
+                continue
+            
+            # Check for buy/sell keywords (English and Vietnamese)
+            want_buy = buy_price is None and _BUY_RE.search(candidate) is not None
+            want_sell = sell_price is None and _SELL_RE.search(candidate) is not None
+            if not want_buy and not want_sell:
+                continue
+            
+            # Look for price in this line and next few lines
+            for k in range(j, min(len(lines), j+5)):
+                if not parsed[k]:
+                    price_val = sanitize_vn_number(lines[k])
+                    if price_val and _GOLD_LO < price_val < _GOLD_TEXT_HI:
+                        prices[k] = price_val
+                    parsed[k] = True
+                if prices[k] is not None:
+                    if want_buy:
+                        buy_price = prices[k]
+                    if want_sell:
+                        sell_price = prices[k]
+                    break
+            
+            if buy_price is not None and sell_price is not None:
+                return buy_price, sell_price
+        
+        return buy_price, sell_price
+    
+    @staticmethod
+    def _persist_last_good_scrape(gold_price: GoldPrice) -> None:
+        """Save a successful scrape result to a JSON file for later fallback."""
+        try:
+            path = Path(GOLD_LAST_GOOD_SCRAPE_FILE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "buy_price": str(gold_price.buy_price),
+                "sell_price": str(gold_price.sell_price),
+                "unit": gold_price.unit,
+                "source": gold_price.source,
+                "timestamp": gold_price.timestamp.isoformat(),
+            }
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except Exception as e:
+            # Persistence is best-effort; never crash the pipeline
+            print(f"Warning: could not persist last good gold price: {e}")
+    
+    @staticmethod
+    def _load_last_good_scrape() -> Optional[GoldPrice]:
+        """Load the persisted scrape from disk, if there is a plausible one."""
+        path = Path(GOLD_LAST_GOOD_SCRAPE_FILE)
+        if not path.is_file():
+            return None
+        
+        data = json.loads(path.read_text(encoding="utf-8"))
+        buy_price = Decimal(data["buy_price"])
+        sell_price = Decimal(data["sell_price"])
+        
+        if buy_price <= _GOLD_LO or sell_price <= _GOLD_LO:
+            print(f"Persisted gold price {sell_price} outside valid range, ignoring")
+            return None
+        
+        return GoldPrice(
+            buy_price=buy_price,
+            sell_price=sell_price,
+            unit=data.get("unit", "VND/tael"),
+            source=f"{data['source']} (cached)",
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
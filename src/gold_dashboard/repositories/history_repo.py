@@ -6,24 +6,31 @@ and falls back to the local history store for assets without APIs (SJC Gold).
 
 import json
 import re
+import threading
 import time
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
+import orjson
 import requests
 
+from ._http import API_HEADERS, SESSION, iter_capped
 from .base import Repository
 from ..config import (
+    CACHE_TTL_SECONDS,
     CHOGIA_AJAX_URL,
     COINGECKO_MARKET_CHART_URL,
-    HEADERS,
     HISTORY_PERIODS,
     REQUEST_TIMEOUT,
     VPS_VN30_API_URL,
     WEBGIA_GOLD_1Y_URL,
 )
-from ..history_store import get_all_entries, get_value_at, record_snapshot
+from ..history_store import get_all_entries, get_value_at, record_snapshots_bulk
 from ..models import (
     AssetHistoricalData,
     DashboardData,
@@ -35,9 +42,18 @@ from .gasoline_repo import GasolineRepository
 # CoinGecko free tier caps historical data at 365 days
 _COINGECKO_MAX_DAYS = 365
 
+# Longest configured period, and the share of it CoinGecko can serve
+_MAX_HISTORY_DAYS = max(HISTORY_PERIODS.values())
+_COINGECKO_FETCH_DAYS = min(_MAX_HISTORY_DAYS, _COINGECKO_MAX_DAYS)
+
 # Regex to extract the "Bán ra" (sell) series from webgia.com inline JS.
 # The page embeds Highcharts data like: {name:"Bán ra", data:[[ts,price],...]}
 _WEBGIA_SELL_RE = re.compile(r"name:.B.n ra.,\s*data:(\[\[.*?\]\])")
+# UTF-8 series label located with a plain byte search before the regex runs
+_WEBGIA_SELL_MARKER = "Bán ra".encode("utf-8")
+
+_MS_PER_DAY = 86_400_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 # Verified historical SJC sell prices (VND/tael) from Vietnamese news archives.
 # These seed the local history store so 3Y data is available immediately.
@@ -276,6 +292,244 @@ _VN30_HISTORICAL_SEEDS: List[Tuple[str, Decimal]] = [
     ("2026-02-10", Decimal("1950.00")),
 ]
 
+ParsedSeeds = List[Tuple[datetime, Decimal]]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD key; scraped dates repeat on every refresh."""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def _parse_seeds(seeds: List[Tuple[str, Decimal]]) -> ParsedSeeds:
+    """Parse a seed table's date strings once, at import time."""
+    return [(_parse_date(date_str), value) for date_str, value in seeds]
+
+
+def _parse_scraped_rates(rates: Dict[str, Decimal]) -> ParsedSeeds:
+    """Parse scraped YYYY-MM-DD keys, skipping any that are malformed."""
+    parsed: ParsedSeeds = []
+    for date_str, value in rates.items():
+        try:
+            parsed.append((_parse_date(date_str), value))
+        except (ValueError, TypeError):
+            continue
+    return parsed
+
+
+_SJC_HISTORICAL_SEEDS_PARSED = _parse_seeds(_SJC_HISTORICAL_SEEDS)
+_USD_VND_HISTORICAL_SEEDS_PARSED = _parse_seeds(_USD_VND_HISTORICAL_SEEDS)
+_BTC_VND_HISTORICAL_SEEDS_PARSED = _parse_seeds(_BTC_VND_HISTORICAL_SEEDS)
+_LAND_HISTORICAL_SEEDS_PARSED = _parse_seeds(_LAND_HISTORICAL_SEEDS)
+_GASOLINE_HISTORICAL_SEEDS_PARSED = _parse_seeds(_GASOLINE_HISTORICAL_SEEDS)
+_VN30_HISTORICAL_SEEDS_PARSED = _parse_seeds(_VN30_HISTORICAL_SEEDS)
+
+# Seed table view for _find_seed_rate: ascending date ordinals and their values
+SeedIndex = Tuple[List[int], List[Decimal]]
+
+
+def _build_seed_index(seeds: ParsedSeeds) -> SeedIndex:
+    """Turn parsed seeds into parallel sorted ordinal/value lists.
+
+    The first entry wins for a repeated date, matching the old linear scan.
+    """
+    by_ordinal: Dict[int, Decimal] = {}
+    for dt, value in seeds:
+        by_ordinal.setdefault(dt.toordinal(), value)
+    ordinals = sorted(by_ordinal)
+    return ordinals, [by_ordinal[ordinal] for ordinal in ordinals]
+
+
+_SJC_SEED_INDEX = _build_seed_index(_SJC_HISTORICAL_SEEDS_PARSED)
+_USD_VND_SEED_INDEX = _build_seed_index(_USD_VND_HISTORICAL_SEEDS_PARSED)
+_BTC_VND_SEED_INDEX = _build_seed_index(_BTC_VND_HISTORICAL_SEEDS_PARSED)
+_LAND_SEED_INDEX = _build_seed_index(_LAND_HISTORICAL_SEEDS_PARSED)
+_GASOLINE_SEED_INDEX = _build_seed_index(_GASOLINE_HISTORICAL_SEEDS_PARSED)
+_VN30_SEED_INDEX = _build_seed_index(_VN30_HISTORICAL_SEEDS_PARSED)
+
+# Chart-ready float views of the seeds each _*_timeseries starts from
+# (VN30 seeds are deliberately kept off the chart)
+_SJC_SEEDS_FLOAT = {d: float(v) for d, v in _SJC_HISTORICAL_SEEDS}
+_USD_VND_SEEDS_FLOAT = {d: float(v) for d, v in _USD_VND_HISTORICAL_SEEDS}
+_BTC_VND_SEEDS_FLOAT = {d: float(v) for d, v in _BTC_VND_HISTORICAL_SEEDS}
+_LAND_SEEDS_FLOAT = {d: float(v) for d, v in _LAND_HISTORICAL_SEEDS}
+_GASOLINE_SEEDS_FLOAT = {d: float(v) for d, v in _GASOLINE_HISTORICAL_SEEDS}
+
+T = TypeVar("T")
+
+# In-process memo of raw endpoint payloads, keyed by (method name, *args).
+# fetch_changes and fetch_timeseries run back to back on every refresh and
+# would otherwise request the same history endpoints twice.
+_history_memo: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_history_memo_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+_history_memo_guard = threading.Lock()
+
+
+def _memoized(func: Callable[..., T]) -> Callable[..., T]:
+    """Reuse a history fetch's result for CACHE_TTL_SECONDS within the process.
+
+    Failures are not memoized, so the next caller retries the endpoint.
+    Concurrent callers for the same key wait for a single request.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args: Any) -> T:
+        key = (func.__name__, *args)
+        with _history_memo_guard:
+            lock = _history_memo_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            hit = _history_memo.get(key)
+            if hit is not None and time.monotonic() - hit[0] < CACHE_TTL_SECONDS:
+                return hit[1]
+            value = func(self, *args)
+            _history_memo[key] = (time.monotonic(), value)
+            return value
+
+    return wrapper
+
+
+class _CircuitBreaker:
+    """Skip an endpoint for a while after repeated consecutive failures.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    calls fail immediately instead of waiting out REQUEST_TIMEOUT.  Once
+    ``recovery_timeout`` seconds pass a single trial call is let through;
+    its success closes the circuit, its failure re-opens it.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 3, recovery_timeout: float = 60
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures."""
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    def _allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight:
+                return False
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            # Half-open: let exactly one trial request through
+            self._trial_in_flight = True
+            return True
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self.reset()
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any) -> T:
+            if not self._allow():
+                # A requests error, so callers fall back as for any failed fetch
+                raise requests.exceptions.ConnectionError(
+                    f"{self.name} circuit open after repeated failures"
+                )
+            try:
+                value = func(*args)
+            except Exception:
+                self._record_failure()
+                raise
+            self._record_success()
+            return value
+
+        return wrapper
+
+
+# One breaker per host; chogia.vn serves both the gold and USD/VND series
+_WEBGIA_BREAKER = _CircuitBreaker("webgia.com")
+_CHOGIA_BREAKER = _CircuitBreaker("chogia.vn")
+_COINGECKO_BREAKER = _CircuitBreaker("CoinGecko")
+_VPS_BREAKER = _CircuitBreaker("VPS")
+_CIRCUIT_BREAKERS = (_WEBGIA_BREAKER, _CHOGIA_BREAKER, _COINGECKO_BREAKER, _VPS_BREAKER)
+
+# Assets whose seed table has already been written by this process
+_seeded_assets: Set[str] = set()
+
+
+def _seed_once(asset: str, seeds: ParsedSeeds) -> None:
+    """Write *asset*'s seed table to the local store once per process.
+
+    Seeds never change at runtime, so later calls return without touching
+    the store.  Each asset is seeded from a single fetch thread.
+    """
+    if asset in _seeded_assets:
+        return
+    record_snapshots_bulk(asset, seeds)
+    _seeded_assets.add(asset)
+
+
+# Day offsets tried by _find_chogia_rate and _find_closest_price, nearest
+# first; later days win ties
+_NEAREST_DAY_OFFSETS = (0, 1, -1, 2, -2, 3, -3)
+
+# (asset key, log label, HistoryRepository method) for fetch_timeseries
+_TIMESERIES = (
+    ("gold", "Gold", "_gold_timeseries"),
+    ("usd_vnd", "USD/VND", "_usd_vnd_timeseries"),
+    ("bitcoin", "Bitcoin", "_bitcoin_timeseries"),
+    ("vn30", "VN30", "_vn30_timeseries"),
+    ("land", "Land", "_land_timeseries"),
+    ("gasoline", "Gasoline", "_gasoline_timeseries"),
+)
+
+
+def _read_webgia_sell_series(response: requests.Response) -> Optional[re.Match]:
+    """Stream the webgia page only until the sell series has been received.
+
+    The UTF-8 series label is located with a byte search as chunks arrive;
+    once the closing ``]]`` after it is in the buffer the rest of the ~1 MB
+    page is never downloaded, and _WEBGIA_SELL_RE runs only on the decoded
+    tail.  Pages that are not UTF-8 encoded fall back to scanning the whole
+    decoded body.
+    """
+    buffer = bytearray()
+    marker_at = -1
+    for chunk in iter_capped(response):
+        # Re-check the previous chunk's tail in case the label straddles it
+        scan_from = max(0, len(buffer) - len(_WEBGIA_SELL_MARKER) + 1)
+        buffer += chunk
+        if marker_at < 0:
+            marker_at = buffer.find(_WEBGIA_SELL_MARKER, scan_from)
+        if marker_at >= 0 and buffer.find(b"]]", marker_at) >= 0:
+            break
+
+    if marker_at < 0:
+        return _WEBGIA_SELL_RE.search(
+            buffer.decode(response.encoding or "utf-8", errors="replace")
+        )
+    window = buffer[max(0, marker_at - 16):].decode("utf-8", errors="replace")
+    return _WEBGIA_SELL_RE.search(window)
+
+
+def _unix_day_key(day_key: int) -> str:
+    """Format a unix-day key (days since 1970-01-01 UTC) as YYYY-MM-DD."""
+    return date.fromordinal(day_key + _EPOCH_ORDINAL).isoformat()
+
+
+def _sorted_series(merged: Dict[str, float]) -> List[List]:
+    """Emit a date -> value map as [[date_str, value], ...] sorted by date."""
+    return [[d, v] for d, v in sorted(merged.items(), key=itemgetter(0))]
+
 
 def _compute_change_percent(old_value: Decimal, new_value: Decimal) -> Decimal:
     """Compute percentage change from old to new, rounded to 2 decimal places."""
@@ -293,6 +547,9 @@ class HistoryRepository:
     single failure never blocks the rest.
     """
 
+    # Stateless: fetched payloads live in the module-level _history_memo
+    __slots__ = ()
+
     def fetch_changes(
         self, current_data: DashboardData
     ) -> Dict[str, AssetHistoricalData]:
@@ -305,27 +562,36 @@ class HistoryRepository:
         Returns:
             Dict like {"gold": AssetHistoricalData(...), "bitcoin": ...}
         """
-        result: Dict[str, AssetHistoricalData] = {}
+        # (asset key, change builder, its argument) for every asset present
+        jobs = []
 
         if current_data.gold:
-            result["gold"] = self._gold_changes(current_data.gold.sell_price)
+            jobs.append(("gold", self._gold_changes, current_data.gold.sell_price))
 
         if current_data.usd_vnd:
-            result["usd_vnd"] = self._usd_vnd_changes(current_data.usd_vnd.sell_rate)
+            jobs.append(("usd_vnd", self._usd_vnd_changes, current_data.usd_vnd.sell_rate))
 
         if current_data.bitcoin:
-            result["bitcoin"] = self._bitcoin_changes(current_data.bitcoin.btc_to_vnd)
+            jobs.append(("bitcoin", self._bitcoin_changes, current_data.bitcoin.btc_to_vnd))
 
         if current_data.vn30:
-            result["vn30"] = self._vn30_changes(current_data.vn30.index_value)
+            jobs.append(("vn30", self._vn30_changes, current_data.vn30.index_value))
 
         if current_data.land:
-            result["land"] = self._land_changes(current_data.land.price_per_m2)
+            jobs.append(("land", self._land_changes, current_data.land.price_per_m2))
 
         if current_data.gasoline:
-            result["gasoline"] = self._gasoline_changes(current_data.gasoline)
+            jobs.append(("gasoline", self._gasoline_changes, current_data.gasoline))
+
+        if not jobs:
+            return {}
 
-        return result
+        # Each asset's lookups hit independent endpoints; run them together
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [
+                (key, executor.submit(build, value)) for key, build, value in jobs
+            ]
+            return {key: future.result() for key, future in futures}
 
     # ------------------------------------------------------------------
     # Time-series export (for frontend charts)
@@ -349,76 +615,37 @@ class HistoryRepository:
         """
         result: Dict[str, List[List]] = {}
 
-        try:
-            result["gold"] = self._gold_timeseries()
-            print(f"  ✓ Gold timeseries: {len(result['gold'])} points")
-        except Exception as e:
-            print(f"  ⚠ Gold timeseries failed: {e}")
-
-        try:
-            result["usd_vnd"] = self._usd_vnd_timeseries()
-            print(f"  ✓ USD/VND timeseries: {len(result['usd_vnd'])} points")
-        except Exception as e:
-            print(f"  ⚠ USD/VND timeseries failed: {e}")
-
-        try:
-            result["bitcoin"] = self._bitcoin_timeseries()
-            print(f"  ✓ Bitcoin timeseries: {len(result['bitcoin'])} points")
-        except Exception as e:
-            print(f"  ⚠ Bitcoin timeseries failed: {e}")
-
-        try:
-            result["vn30"] = self._vn30_timeseries()
-            print(f"  ✓ VN30 timeseries: {len(result['vn30'])} points")
-        except Exception as e:
-            print(f"  ⚠ VN30 timeseries failed: {e}")
-
-        try:
-            result["land"] = self._land_timeseries()
-            print(f"  ✓ Land timeseries: {len(result['land'])} points")
-        except Exception as e:
-            print(f"  ⚠ Land timeseries failed: {e}")
-
-        try:
-            result["gasoline"] = self._gasoline_timeseries()
-            print(f"  ✓ Gasoline timeseries: {len(result['gasoline'])} points")
-        except Exception as e:
-            print(f"  ⚠ Gasoline timeseries failed: {e}")
+        # Each asset's series comes from independent endpoints or the local
+        # store; fetch them together and log each as it completes
+        with ThreadPoolExecutor(max_workers=len(_TIMESERIES)) as executor:
+            futures = {
+                executor.submit(getattr(self, method)): (key, label)
+                for key, label, method in _TIMESERIES
+            }
+            for future in as_completed(futures):
+                key, label = futures[future]
+                try:
+                    result[key] = future.result()
+                    print(f"  ✓ {label} timeseries: {len(result[key])} points")
+                except Exception as e:
+                    print(f"  ⚠ {label} timeseries failed: {e}")
 
-        return result
+        # Keep the asset order stable regardless of completion order
+        return {key: result[key] for key, _, _ in _TIMESERIES if key in result}
 
     def _gold_timeseries(self) -> List[List]:
         """Merge webgia + chogia + seed data into a sorted date/value list."""
-        merged: Dict[str, float] = {}
-
         # Seeds first (lowest priority — overwritten by API data)
-        for date_str, val in _SJC_HISTORICAL_SEEDS:
-            merged[date_str] = float(val)
-
-        # webgia.com (~282 points, ~1 year)
-        try:
-            rates = self._fetch_webgia_gold_history()
-            for d, v in rates.items():
-                merged[d] = float(v)
-        except Exception:
-            pass
+        merged: Dict[str, float] = dict(_SJC_SEEDS_FLOAT)
 
-        # chogia.vn (~30 days)
-        try:
-            rates = self._fetch_chogia_gold_history()
-            for d, v in rates.items():
-                merged[d] = float(v)
-        except Exception:
-            pass
+        for d, v in self._fetch_gold_history().items():
+            merged[d] = float(v)
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     def _land_timeseries(self) -> List[List]:
         """Merge seeded and locally-recorded land prices into a sorted date/value list."""
-        merged: Dict[str, float] = {}
-
-        for date_str, val in _LAND_HISTORICAL_SEEDS:
-            merged[date_str] = float(val)
+        merged: Dict[str, float] = dict(_LAND_SEEDS_FLOAT)
 
         for entry in get_all_entries("land"):
             date_str = entry.get("date")
@@ -430,17 +657,14 @@ class HistoryRepository:
             except Exception:
                 continue
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     def _gasoline_timeseries(self) -> List[List]:
         """Merge _GASOLINE_HISTORICAL_SEEDS with locally-recorded gasoline prices
         into a sorted [[date_str, float], ...] list.
         Seeds are lowest priority; local store entries override if same date.
         Returns list sorted ascending by date string (YYYY-MM-DD)."""
-        merged: Dict[str, float] = {}
-
-        for date_str, val in _GASOLINE_HISTORICAL_SEEDS:
-            merged[date_str] = float(val)
+        merged: Dict[str, float] = dict(_GASOLINE_SEEDS_FLOAT)
 
         for entry in get_all_entries("gasoline"):
             date_str = entry.get("date")
@@ -452,14 +676,11 @@ class HistoryRepository:
             except Exception:
                 continue
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     def _usd_vnd_timeseries(self) -> List[List]:
         """Merge chogia + seed data into a sorted date/value list."""
-        merged: Dict[str, float] = {}
-
-        for date_str, val in _USD_VND_HISTORICAL_SEEDS:
-            merged[date_str] = float(val)
+        merged: Dict[str, float] = dict(_USD_VND_SEEDS_FLOAT)
 
         try:
             rates = self._fetch_chogia_history()
@@ -468,25 +689,20 @@ class HistoryRepository:
         except Exception:
             pass
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     def _bitcoin_timeseries(self) -> List[List]:
         """Merge CoinGecko + seed data into a sorted date/value list."""
-        merged: Dict[str, float] = {}
-
-        for date_str, val in _BTC_VND_HISTORICAL_SEEDS:
-            merged[date_str] = float(val)
+        merged: Dict[str, float] = dict(_BTC_VND_SEEDS_FLOAT)
 
         try:
-            fetch_days = min(max(HISTORY_PERIODS.values()), _COINGECKO_MAX_DAYS)
-            day_prices = self._fetch_coingecko_history(fetch_days)
+            day_prices = self._fetch_coingecko_history(_COINGECKO_FETCH_DAYS)
             for day_key, val in day_prices.items():
-                dt = datetime.fromtimestamp(day_key * 86400)
-                merged[dt.strftime("%Y-%m-%d")] = float(val)
+                merged[_unix_day_key(day_key)] = float(val)
         except Exception:
             pass
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     def _vn30_timeseries(self) -> List[List]:
         """Fetch VPS TradingView data into a sorted date/value list.
@@ -499,15 +715,13 @@ class HistoryRepository:
         merged: Dict[str, float] = {}
 
         try:
-            max_days = max(HISTORY_PERIODS.values())
-            day_prices = self._fetch_vps_history(max_days)
+            day_prices = self._fetch_vps_history(_MAX_HISTORY_DAYS)
             for day_key, val in day_prices.items():
-                dt = datetime.fromtimestamp(day_key * 86400)
-                merged[dt.strftime("%Y-%m-%d")] = float(val)
+                merged[_unix_day_key(day_key)] = float(val)
         except Exception:
             pass
 
-        return sorted([d, v] for d, v in merged.items())
+        return _sorted_series(merged)
 
     # ------------------------------------------------------------------
     # Gold — webgia.com (~1 year) + chogia.vn (~30 days) + local store
@@ -517,11 +731,11 @@ class HistoryRepository:
         """
         Compute SJC gold price changes using a tiered strategy:
 
-        1. **webgia.com** — embeds ~282 days of real SJC sell prices in
-           inline Highcharts JS.  Covers 1W, 1M, and 1Y.
-        2. **chogia.vn** — AJAX endpoint with ~30 days of SJC prices.
-           Used as fallback for recent data if webgia is down.
-        3. **Local history store** — seeded with verified news prices
+        1. **webgia.com + chogia.vn** — fetched concurrently and merged.
+           webgia embeds ~282 days of real SJC sell prices in inline
+           Highcharts JS (1W, 1M, 1Y); chogia's ~30 days of finer-grained
+           prices override it on overlapping dates.
+        2. **Local history store** — seeded with verified news prices
            for 3Y, and backfilled with scraped data on every run.
         """
         changes = []
@@ -530,36 +744,17 @@ class HistoryRepository:
         # Ensure verified historical seeds are in the local store (for 3Y)
         self._seed_historical_gold()
 
-        # Primary: webgia.com 1-year chart (~282 data points)
-        webgia_rates: Optional[Dict[str, Decimal]] = None
-        try:
-            webgia_rates = self._fetch_webgia_gold_history()
-            if webgia_rates:
-                self._backfill_gold_history(webgia_rates)
-        except (requests.exceptions.RequestException, ValueError, KeyError):
-            pass
-
-        # Fallback: chogia.vn ~30 days (finer granularity for recent data)
-        chogia_rates: Optional[Dict[str, Decimal]] = None
-        if webgia_rates is None:
-            try:
-                chogia_rates = self._fetch_chogia_gold_history()
-                if chogia_rates:
-                    self._backfill_gold_history(chogia_rates)
-            except (requests.exceptions.RequestException, ValueError, KeyError):
-                pass
+        scraped_rates = self._fetch_gold_history()
+        if scraped_rates:
+            self._backfill_gold_history(scraped_rates)
 
         for label, days in HISTORY_PERIODS.items():
             target_date = now - timedelta(days=days)
             old_value: Optional[Decimal] = None
 
-            # Try webgia.com data first (covers ~1 year)
-            if webgia_rates is not None:
-                old_value = self._find_chogia_rate(webgia_rates, target_date)
-
-            # Try chogia.vn data (covers ~30 days)
-            if old_value is None and chogia_rates is not None:
-                old_value = self._find_chogia_rate(chogia_rates, target_date)
+            # Try scraped webgia.com/chogia.vn data first (covers ~1 year)
+            if scraped_rates:
+                old_value = self._find_chogia_rate(scraped_rates, target_date)
 
             # Fall back to local history store (has 3Y seeds + backfilled data)
             if old_value is None:
@@ -569,7 +764,7 @@ class HistoryRepository:
             # are present (e.g., +5 days from anniversary in CI/runtime).
             if old_value is None and label == "3Y":
                 old_value = self._find_seed_rate(
-                    _SJC_HISTORICAL_SEEDS,
+                    _SJC_SEED_INDEX,
                     target_date,
                     max_delta_days=45,
                 )
@@ -585,6 +780,29 @@ class HistoryRepository:
 
         return AssetHistoricalData(asset_name="gold", changes=changes)
 
+    def _fetch_gold_history(self) -> Dict[str, Decimal]:
+        """Fetch webgia.com and chogia.vn SJC history concurrently and merge.
+
+        The two sources are different hosts, so wall time is the slower of
+        the two rather than their sum.  chogia.vn wins overlapping dates;
+        a source that fails simply contributes nothing.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = (
+                executor.submit(self._fetch_webgia_gold_history),
+                executor.submit(self._fetch_chogia_gold_history),
+            )
+
+        rates: Dict[str, Decimal] = {}
+        for future in futures:
+            try:
+                rates.update(future.result())
+            except Exception:
+                continue
+        return rates
+
+    @_memoized
+    @_WEBGIA_BREAKER
     def _fetch_webgia_gold_history(self) -> Dict[str, Decimal]:
         """
         GET webgia.com 1-year SJC chart page and extract inline Highcharts data.
@@ -595,31 +813,34 @@ class HistoryRepository:
         Prices are in millions VND (e.g. 90.3 = 90,300,000 VND).
         Returns a dict mapping YYYY-MM-DD -> Decimal full VND price.
         """
-        response = requests.get(
-            WEBGIA_GOLD_1Y_URL,
-            headers=HEADERS,
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
+        with SESSION.get(
+            WEBGIA_GOLD_1Y_URL, timeout=REQUEST_TIMEOUT, stream=True
+        ) as response:
+            response.raise_for_status()
+            match = _read_webgia_sell_series(response)
 
-        match = _WEBGIA_SELL_RE.search(response.text)
         if not match:
             raise ValueError("Could not find sell series in webgia.com HTML")
 
-        raw_data: List[List[float]] = json.loads(match.group(1))
+        # Decode prices straight into Decimal instead of float -> str -> Decimal
+        raw_data: List[List[Any]] = json.loads(match.group(1), parse_float=Decimal)
 
         rates: Dict[str, Decimal] = {}
         for ts_ms, price_millions in raw_data:
             try:
-                dt = datetime.fromtimestamp(ts_ms / 1000)
-                date_key = dt.strftime("%Y-%m-%d")
+                # Epoch-day arithmetic instead of fromtimestamp + strftime;
+                # days are UTC, as on the scheduled runner
+                ordinal = int(ts_ms) // _MS_PER_DAY + _EPOCH_ORDINAL
+                date_key = date.fromordinal(ordinal).isoformat()
                 # Convert millions to full VND (e.g. 90.3 -> 90,300,000)
-                rates[date_key] = Decimal(str(price_millions)) * 1_000_000
-            except (ValueError, OSError):
+                rates[date_key] = Decimal(price_millions) * 1_000_000
+            except (ValueError, OverflowError):
                 continue
 
         return rates
 
+    @_memoized
+    @_CHOGIA_BREAKER
     def _fetch_chogia_gold_history(self) -> Dict[str, Decimal]:
         """
         POST chogia.vn AJAX endpoint for SJC gold historical prices.
@@ -631,12 +852,9 @@ class HistoryRepository:
         from the current date.  Prices are in thousands (e.g. 181030 =
         181,030,000 VND).
         """
-        response = requests.post(
+        response = SESSION.post(
             CHOGIA_AJAX_URL,
-            headers={
-                **HEADERS,
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
             data={
                 "action": "load_gia_vang_cho_do_thi",
                 "congty": "SJC",
@@ -644,7 +862,8 @@ class HistoryRepository:
             timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
-        data = response.json()
+        # orjson decodes the raw bytes, skipping requests' charset sniffing
+        data = orjson.loads(response.content)
 
         if not data.get("success") or not data.get("data"):
             raise ValueError("chogia.vn returned unsuccessful gold response")
@@ -682,15 +901,10 @@ class HistoryRepository:
         """
         Plant verified SJC prices from news archives into the local store.
 
-        This runs on every call but ``record_snapshot`` deduplicates by date,
-        so repeated calls are cheap no-ops after the first seed.
+        The table is written in a single load/save on the first call of
+        the process; later calls are no-ops.
         """
-        for date_str, value in _SJC_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("gold", value, dt)
-            except (ValueError, TypeError):
-                continue
+        _seed_once("gold", _SJC_HISTORICAL_SEEDS_PARSED)
 
     @staticmethod
     def _backfill_gold_history(rates: Dict[str, Decimal]) -> None:
@@ -700,12 +914,7 @@ class HistoryRepository:
         This ensures that over time the store accumulates a full multi-year
         record of real SJC prices from webgia.com and chogia.vn.
         """
-        for date_str, value in rates.items():
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("gold", value, dt)
-            except (ValueError, TypeError):
-                continue
+        record_snapshots_bulk("gold", _parse_scraped_rates(rates))
 
     # ------------------------------------------------------------------
     # USD/VND — chogia.vn (30 days of history) + local store fallback
@@ -748,7 +957,7 @@ class HistoryRepository:
 
             # Seed-nearest fallback for sparse monthly anchors (prevents null 1Y/3Y gaps)
             if old_value is None:
-                old_value = self._find_seed_rate(_USD_VND_HISTORICAL_SEEDS, target_date)
+                old_value = self._find_seed_rate(_USD_VND_SEED_INDEX, target_date)
 
             change = HistoricalChange(period=label, new_value=current_value)
             if old_value is not None:
@@ -761,17 +970,16 @@ class HistoryRepository:
 
         return AssetHistoricalData(asset_name="usd_vnd", changes=changes)
 
+    @_memoized
+    @_CHOGIA_BREAKER
     def _fetch_chogia_history(self) -> Dict[str, Decimal]:
         """
         POST chogia.vn AJAX endpoint for USD historical rates.
         Returns a dict mapping date strings (YYYY-MM-DD) to sell rates.
         """
-        response = requests.post(
+        response = SESSION.post(
             CHOGIA_AJAX_URL,
-            headers={
-                **HEADERS,
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
             data={
                 "action": "load_gia_ngoai_te_cho_do_thi",
                 "ma": "USD",
@@ -779,7 +987,8 @@ class HistoryRepository:
             timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
-        data = response.json()
+        # orjson decodes the raw bytes, skipping requests' charset sniffing
+        data = orjson.loads(response.content)
 
         if not data.get("success") or not data.get("data"):
             raise ValueError("chogia.vn returned unsuccessful response")
@@ -797,15 +1006,9 @@ class HistoryRepository:
     def _seed_historical_usd_vnd() -> None:
         """Plant verified black-market USD/VND rates into the local store.
 
-        Mirrors ``_seed_historical_gold``.  ``record_snapshot`` deduplicates
-        by date, so repeated calls are cheap no-ops.
+        Mirrors ``_seed_historical_gold``: written once per process.
         """
-        for date_str, value in _USD_VND_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("usd_vnd", value, dt)
-            except (ValueError, TypeError):
-                continue
+        _seed_once("usd_vnd", _USD_VND_HISTORICAL_SEEDS_PARSED)
 
     @staticmethod
     def _backfill_usd_vnd_history(rates: Dict[str, Decimal]) -> None:
@@ -814,50 +1017,45 @@ class HistoryRepository:
         Over time the store accumulates a multi-year record of real
         black-market rates from chogia.vn.
         """
-        for date_str, value in rates.items():
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("usd_vnd", value, dt)
-            except (ValueError, TypeError):
-                continue
+        record_snapshots_bulk("usd_vnd", _parse_scraped_rates(rates))
 
     @staticmethod
     def _find_chogia_rate(
         rates: Dict[str, Decimal], target: datetime
     ) -> Optional[Decimal]:
         """Find the chogia.vn rate closest to *target* within ±3 days."""
-        for offset in range(4):
-            for sign in (0, 1, -1):
-                check_date = target + timedelta(days=sign * offset)
-                key = check_date.strftime("%Y-%m-%d")
-                if key in rates:
-                    return rates[key]
+        target_ordinal = target.toordinal()
+        for offset in _NEAREST_DAY_OFFSETS:
+            value = rates.get(date.fromordinal(target_ordinal + offset).isoformat())
+            if value is not None:
+                return value
         return None
 
     @staticmethod
     def _find_seed_rate(
-        seeds: List[Tuple[str, Decimal]],
+        seed_index: SeedIndex,
         target: datetime,
         max_delta_days: int = 20,
     ) -> Optional[Decimal]:
         """Find nearest seed value to target date within an expanded tolerance window."""
-        target_day = target.date()
+        ordinals, values = seed_index
+        target_ordinal = target.toordinal()
+        i = bisect_left(ordinals, target_ordinal)
+
         best_value: Optional[Decimal] = None
         best_delta: Optional[int] = None
 
-        for date_str, value in seeds:
-            try:
-                seed_day = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except ValueError:
+        # Only the neighbours either side of the insertion point can be nearest;
+        # the earlier one is checked first so it wins a tie, as before
+        for j in (i - 1, i):
+            if not 0 <= j < len(ordinals):
                 continue
-
-            delta_days = abs((seed_day - target_day).days)
+            delta_days = abs(ordinals[j] - target_ordinal)
             if delta_days > max_delta_days:
                 continue
-
             if best_delta is None or delta_days < best_delta:
                 best_delta = delta_days
-                best_value = value
+                best_value = values[j]
 
         return best_value
 
@@ -881,11 +1079,10 @@ class HistoryRepository:
         self._seed_historical_bitcoin()
 
         # Fetch the largest *supported* window once and reuse for all periods
-        fetch_days = min(max(HISTORY_PERIODS.values()), _COINGECKO_MAX_DAYS)
         price_history: Optional[Dict[int, Decimal]] = None
 
         try:
-            price_history = self._fetch_coingecko_history(fetch_days)
+            price_history = self._fetch_coingecko_history(_COINGECKO_FETCH_DAYS)
             if price_history:
                 self._backfill_bitcoin_history(price_history)
         except (requests.exceptions.RequestException, ValueError, KeyError):
@@ -906,7 +1103,7 @@ class HistoryRepository:
             # Seed-nearest fallback for 3Y (CoinGecko free tier caps at 365 days)
             if old_value is None and label == "3Y":
                 old_value = self._find_seed_rate(
-                    _BTC_VND_HISTORICAL_SEEDS,
+                    _BTC_VND_SEED_INDEX,
                     target_date,
                     max_delta_days=45,
                 )
@@ -922,6 +1119,8 @@ class HistoryRepository:
 
         return AssetHistoricalData(asset_name="bitcoin", changes=changes)
 
+    @_memoized
+    @_COINGECKO_BREAKER
     def _fetch_coingecko_history(self, days: int) -> Dict[int, Decimal]:
         """
         GET .../market_chart?vs_currency=vnd&days=N
@@ -929,11 +1128,7 @@ class HistoryRepository:
         We build a dict mapping unix-day -> Decimal price.
         """
         url = f"{COINGECKO_MARKET_CHART_URL}&days={days}"
-        response = requests.get(
-            url,
-            headers={"User-Agent": HEADERS["User-Agent"]},
-            timeout=REQUEST_TIMEOUT,
-        )
+        response = SESSION.get(url, headers=API_HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
 
@@ -951,28 +1146,24 @@ class HistoryRepository:
 
         Mirrors ``_seed_historical_gold``.  Prices are BTC/USD from
         Investopedia/CoinGecko multiplied by the contemporary USD/VND rate.
-        ``record_snapshot`` deduplicates by date.
+        Runs once per process.
         """
-        for date_str, value in _BTC_VND_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("bitcoin", value, dt)
-            except (ValueError, TypeError):
-                continue
+        _seed_once("bitcoin", _BTC_VND_HISTORICAL_SEEDS_PARSED)
 
     @staticmethod
     def _backfill_bitcoin_history(day_prices: Dict[int, Decimal]) -> None:
         """Persist CoinGecko BTC/VND data into the local history store.
 
-        Converts unix-day keys to date strings and records each snapshot.
+        Converts unix-day keys to datetimes and records them in one batch.
         Over time the store accumulates a multi-year record.
         """
+        snapshots: ParsedSeeds = []
         for day_key, value in day_prices.items():
             try:
-                dt = datetime.fromtimestamp(day_key * 86400)
-                record_snapshot("bitcoin", value, dt)
+                snapshots.append((datetime.fromtimestamp(day_key * 86400), value))
             except (ValueError, TypeError, OSError):
                 continue
+        record_snapshots_bulk("bitcoin", snapshots)
 
     @staticmethod
     def _find_closest_price(
@@ -980,11 +1171,10 @@ class HistoryRepository:
     ) -> Optional[Decimal]:
         """Find the price entry closest to *target* within ±3 days."""
         target_day = int(target.timestamp() / 86400)
-        for offset in range(4):
-            if target_day + offset in day_prices:
-                return day_prices[target_day + offset]
-            if target_day - offset in day_prices:
-                return day_prices[target_day - offset]
+        for offset in _NEAREST_DAY_OFFSETS:
+            value = day_prices.get(target_day + offset)
+            if value is not None:
+                return value
         return None
 
     # ------------------------------------------------------------------
@@ -1000,11 +1190,10 @@ class HistoryRepository:
         self._seed_historical_vn30()
 
         # Fetch the longest period once
-        max_days = max(HISTORY_PERIODS.values())
         close_history: Optional[Dict[int, Decimal]] = None
 
         try:
-            close_history = self._fetch_vps_history(max_days)
+            close_history = self._fetch_vps_history(_MAX_HISTORY_DAYS)
         except (requests.exceptions.RequestException, ValueError, KeyError):
             pass
 
@@ -1021,7 +1210,7 @@ class HistoryRepository:
             # Seed-nearest fallback only for long-horizon 3Y period
             if old_value is None and label == "3Y":
                 old_value = self._find_seed_rate(
-                    _VN30_HISTORICAL_SEEDS,
+                    _VN30_SEED_INDEX,
                     target_date,
                     max_delta_days=45,
                 )
@@ -1050,7 +1239,7 @@ class HistoryRepository:
 
             if old_value is None:
                 old_value = self._find_seed_rate(
-                    _LAND_HISTORICAL_SEEDS,
+                    _LAND_SEED_INDEX,
                     target_date,
                     max_delta_days=45,
                 )
@@ -1070,7 +1259,7 @@ class HistoryRepository:
         """Compute RON 95-III % change for each period using local store + seeds.
         Calls _seed_historical_gasoline() first to ensure 3Y coverage.
         For each period: tries get_value_at("gasoline", target_date), then
-        _find_seed_rate(_GASOLINE_HISTORICAL_SEEDS, target_date, max_delta_days=20).
+        _find_seed_rate(_GASOLINE_SEED_INDEX, target_date, max_delta_days=20).
         For 3Y period: uses max_delta_days=45.
         Returns AssetHistoricalData(asset_name="gasoline", changes=[...])."""
         changes = []
@@ -1090,7 +1279,7 @@ class HistoryRepository:
             if old_value is None:
                 max_delta = 45 if label == "3Y" else 20
                 old_value = self._find_seed_rate(
-                    _GASOLINE_HISTORICAL_SEEDS,
+                    _GASOLINE_SEED_INDEX,
                     target_date,
                     max_delta_days=max_delta,
                 )
@@ -1109,37 +1298,35 @@ class HistoryRepository:
     @staticmethod
     def _seed_historical_land() -> None:
         """Plant verified/curated land anchors into the local history store."""
-        for date_str, value in _LAND_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("land", value, dt)
-            except (ValueError, TypeError):
-                continue
+        _seed_once("land", _LAND_HISTORICAL_SEEDS_PARSED)
 
     @staticmethod
     def _seed_historical_gasoline() -> None:
         """Plant all _GASOLINE_HISTORICAL_SEEDS into the local history store.
-        Calls record_snapshot("gasoline", value, dt) for each seed entry.
-        record_snapshot deduplicates by date — repeated calls are no-ops."""
-        for date_str, value in _GASOLINE_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                record_snapshot("gasoline", value, dt)
-            except (ValueError, TypeError):
-                continue
+        Writes every seed entry with one record_snapshots_bulk("gasoline", ...)
+        the first time it is called; later calls in the process are no-ops."""
+        _seed_once("gasoline", _GASOLINE_HISTORICAL_SEEDS_PARSED)
 
     @staticmethod
     def _seed_historical_vn30() -> None:
-        """Plant verified VN30 index closes into the local history store."""
-        for date_str, value in _VN30_HISTORICAL_SEEDS:
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-                if get_value_at("vn30", dt) is not None:
-                    continue
-                record_snapshot("vn30", value, dt)
-            except (ValueError, TypeError):
-                continue
+        """Plant verified VN30 index closes into the local history store.
+
+        Days that already hold a snapshot are left alone, so the store is
+        only probed on the first call in the process.
+        """
+        if "vn30" in _seeded_assets:
+            return
+        _seed_once(
+            "vn30",
+            [
+                (dt, value)
+                for dt, value in _VN30_HISTORICAL_SEEDS_PARSED
+                if get_value_at("vn30", dt) is None
+            ],
+        )
 
+    @_memoized
+    @_VPS_BREAKER
     def _fetch_vps_history(self, days: int) -> Dict[int, Decimal]:
         """
         GET histdatafeed.vps.com.vn/tradingview/history?symbol=VN30&resolution=D&from=...&to=...
@@ -1150,11 +1337,7 @@ class HistoryRepository:
         from_ts = now_ts - days * 86400
         url = f"{VPS_VN30_API_URL}&from={from_ts}&to={now_ts}"
 
-        response = requests.get(
-            url,
-            headers={"User-Agent": HEADERS["User-Agent"]},
-            timeout=REQUEST_TIMEOUT,
-        )
+        response = SESSION.get(url, headers=API_HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
 
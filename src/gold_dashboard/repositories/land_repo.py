@@ -12,9 +12,9 @@ import requests
 from bs4 import BeautifulSoup
 
 from .base import Repository
+from ._http import SESSION
 from ..config import (
     ALONHADAT_Q11_URL,
-    HEADERS,
     HOMEDY_HONG_BANG_URL,
     LAND_FALLBACK_PRICE_PER_M2,
     LAND_LAST_GOOD_SCRAPE_FILE,
@@ -27,6 +27,26 @@ from ..config import (
 from ..models import LandPrice
 from ..utils import cached
 
+# Unit multipliers and rounding step for listing prices
+_ONE_BILLION = Decimal("1000000000")
+_ONE_MILLION = Decimal("1000000")
+_TEN = Decimal("10")
+_CENT = Decimal("0.01")
+
+# Listing-text patterns, compiled once instead of per Hong Bang snippet
+_HONG_BANG_RE = re.compile(r"h[oồ]ng\s*b[aà]ng", flags=re.IGNORECASE)
+_DIM_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*[xX]\s*(\d+(?:[.,]\d+)?)")
+_AREA_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*m\s*²", flags=re.IGNORECASE)
+_PRICE_TY_RE = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*t(?:ỷ|y)(?:\s*(\d{1,3}))?",
+    flags=re.IGNORECASE,
+)
+# Matches "180,9 tr/m2", "239,1 triệu/m²", "95.5 tr/m²"
+_HOMEDY_PRICE_RE = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*(?:tr|triệu)\s*/\s*m\s*[²2]",
+    flags=re.IGNORECASE,
+)
+
 
 def _parse_vn_number(raw: str) -> str:
     """Convert a Vietnamese-formatted number string to a Python-parseable decimal string.
@@ -106,9 +126,8 @@ class LandRepository(Repository[LandPrice]):
 
     def _fetch_from_alonhadat(self) -> LandPrice:
         """Extract listing-derived VND/m2 values from Quận 11 page and return a robust median."""
-        response = requests.get(
+        response = SESSION.get(
             ALONHADAT_Q11_URL,
-            headers=HEADERS,
             timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
@@ -135,7 +154,7 @@ class LandRepository(Repository[LandPrice]):
         text = BeautifulSoup(html, "lxml").get_text(" ", strip=True)
         prices: List[Decimal] = []
 
-        for match in re.finditer(r"h[oồ]ng\s*b[aà]ng", text, flags=re.IGNORECASE):
+        for match in _HONG_BANG_RE.finditer(text):
             start = max(0, match.start() - 25)
             end = min(len(text), match.end() + 180)
             snippet = text[start:end]
@@ -145,21 +164,21 @@ class LandRepository(Repository[LandPrice]):
             if area is None or area <= 0 or price_billion is None:
                 continue
 
-            price_vnd = price_billion * Decimal("1000000000")
-            prices.append((price_vnd / area).quantize(Decimal("0.01")))
+            price_vnd = price_billion * _ONE_BILLION
+            prices.append((price_vnd / area).quantize(_CENT))
 
         return prices
 
     @staticmethod
     def _extract_area_m2(snippet: str) -> Optional[Decimal]:
         """Parse dimensions like 4x12 or 12 x 20m and return area in m2."""
-        dim_match = re.search(r"(\d+(?:[.,]\d+)?)\s*[xX]\s*(\d+(?:[.,]\d+)?)", snippet)
+        dim_match = _DIM_RE.search(snippet)
         if dim_match:
             width = Decimal(dim_match.group(1).replace(",", "."))
             length = Decimal(dim_match.group(2).replace(",", "."))
             return width * length
 
-        area_match = re.search(r"(\d+(?:[.,]\d+)?)\s*m\s*²", snippet, flags=re.IGNORECASE)
+        area_match = _AREA_RE.search(snippet)
         if area_match:
             return Decimal(area_match.group(1).replace(",", "."))
 
@@ -168,11 +187,7 @@ class LandRepository(Repository[LandPrice]):
     @staticmethod
     def _extract_price_billion(snippet: str) -> Optional[Decimal]:
         """Parse prices like 12 tỷ 5, 9 tỷ 98, or 45 tỷ into billion-VND units."""
-        price_match = re.search(
-            r"(\d+(?:[.,]\d+)?)\s*t(?:ỷ|y)(?:\s*(\d{1,3}))?",
-            snippet,
-            flags=re.IGNORECASE,
-        )
+        price_match = _PRICE_TY_RE.search(snippet)
         if not price_match:
             return None
 
@@ -182,7 +197,7 @@ class LandRepository(Repository[LandPrice]):
             return major
 
         minor = Decimal(minor_part)
-        scale = Decimal("10") ** len(minor_part)
+        scale = _TEN ** len(minor_part)
         return major + (minor / scale)
 
     # ------------------------------------------------------------------
@@ -196,9 +211,8 @@ class LandRepository(Repository[LandPrice]):
         e.g. '180,9 tr/m2'. We extract those, convert from triệu (million)
         to raw VND, filter valid range, and return the median.
         """
-        response = requests.get(
+        response = SESSION.get(
             HOMEDY_HONG_BANG_URL,
-            headers=HEADERS,
             timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
@@ -233,16 +247,10 @@ class LandRepository(Repository[LandPrice]):
         text = BeautifulSoup(html, "lxml").get_text(" ", strip=True)
         prices: List[Decimal] = []
 
-        # Match patterns like "180,9 tr/m2", "239,1 triệu/m²", "95.5 tr/m²"
-        pattern = re.compile(
-            r"(\d+(?:[.,]\d+)?)\s*(?:tr|triệu)\s*/\s*m\s*[²2]",
-            flags=re.IGNORECASE,
-        )
-
-        for match in pattern.finditer(text):
+        for match in _HOMEDY_PRICE_RE.finditer(text):
             try:
                 million_vnd = Decimal(_parse_vn_number(match.group(1)))
-                vnd_per_m2 = million_vnd * Decimal("1000000")
+                vnd_per_m2 = million_vnd * _ONE_MILLION
                 prices.append(vnd_per_m2)
             except (InvalidOperation, ValueError):
                 continue
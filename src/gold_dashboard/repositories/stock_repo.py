@@ -13,8 +13,9 @@ from typing import Optional, Tuple
 from decimal import Decimal
 
 from .base import Repository
+from ._http import API_HEADERS, SESSION
 from ..models import Vn30Index
-from ..config import VIETSTOCK_URL, CAFEF_URL, HEADERS, REQUEST_TIMEOUT, VPS_VN30_API_URL
+from ..config import VIETSTOCK_URL, CAFEF_URL, REQUEST_TIMEOUT, VPS_VN30_API_URL
 from ..utils import cached, sanitize_vn_number
 
 
@@ -66,7 +67,11 @@ class StockRepository(Repository[Vn30Index]):
         )
 
     def _fetch_vps_closes(self, days_back: int, retries: int = 3) -> list[Decimal]:
-        """Fetch VN30 closes from VPS with lightweight retry/backoff."""
+        """Fetch VN30 closes from VPS with lightweight retry/backoff.
+
+        SESSION already retries 502/503/504 itself, so a RetryError is not
+        retried again here; timeouts and bad payloads are.
+        """
         now = int(time.time())
         from_ts = now - days_back * 86400
         url = f"{VPS_VN30_API_URL}&from={from_ts}&to={now}"
@@ -74,9 +79,9 @@ class StockRepository(Repository[Vn30Index]):
         last_exc: Optional[Exception] = None
         for attempt in range(retries):
             try:
-                response = requests.get(
+                response = SESSION.get(
                     url,
-                    headers={"User-Agent": HEADERS["User-Agent"]},
+                    headers=API_HEADERS,
                     timeout=REQUEST_TIMEOUT
                 )
                 response.raise_for_status()
@@ -86,6 +91,8 @@ class StockRepository(Repository[Vn30Index]):
                     raise ValueError("VPS API returned no VN30 data")
 
                 return [Decimal(str(v)) for v in data['c']]
+            except requests.exceptions.RetryError:
+                raise
             except (requests.exceptions.RequestException, ValueError, KeyError) as e:
                 last_exc = e
                 if attempt < retries - 1:
@@ -97,9 +104,8 @@ class StockRepository(Repository[Vn30Index]):
 
     def _fetch_from_vietstock(self) -> Vn30Index:
         """Fetch from Vietstock."""
-        response = requests.get(
+        response = SESSION.get(
             VIETSTOCK_URL,
-            headers=HEADERS,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
@@ -167,9 +173,8 @@ class StockRepository(Repository[Vn30Index]):
 
     def _fetch_from_cafef(self) -> Vn30Index:
         """Fetch from CafeF."""
-        response = requests.get(
+        response = SESSION.get(
             CAFEF_URL,
-            headers=HEADERS,
             timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
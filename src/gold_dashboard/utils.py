@@ -5,10 +5,12 @@ Includes Vietnamese number sanitization and caching decorator.
 
 import os
 import json
+import re
+import threading
 import time
 from decimal import Decimal, InvalidOperation
-from functools import wraps
-from typing import Optional, Callable, Any, TypeVar
+from functools import lru_cache, wraps
+from typing import Optional, Callable, Any, Dict, Set, TypeVar
 from datetime import datetime
 from dataclasses import asdict, is_dataclass
 import requests.exceptions
@@ -17,11 +19,26 @@ from .config import CACHE_DIR, CACHE_TTL_SECONDS
 
 T = TypeVar("T")
 
+# Everything except digits and the two separators sanitize_vn_number understands
+_NON_NUMERIC_RE = re.compile(r"[^\d.,]")
+
+_cache_locks: Dict[str, threading.Lock] = {}
+_cache_locks_guard = threading.Lock()
+# Keys with a stale-while-revalidate refresh in flight (guarded by the above)
+_refreshing: Set[str] = set()
+# Off by default: a one-shot run (generate_data) would publish the stale
+# value and never use the background refresh; see enable_stale_while_revalidate
+_stale_while_revalidate = False
+
 
 def sanitize_vn_number(text: str) -> Optional[Decimal]:
     """
     Convert Vietnamese or international number format to Decimal.
 
+    Results for str inputs are memoized: scrapers call this for every
+    candidate line and the same layout strings recur across passes and
+    refreshes.  Any other input (None, lists, ...) returns None uncached.
+
     Handles two formats:
     - Vietnamese: '.' for thousands (e.g., 80.000.000), ',' for decimal (e.g., 1.234,56)
     - International: ',' for thousands (e.g., 2,029.81), '.' for decimal
@@ -42,10 +59,19 @@ def sanitize_vn_number(text: str) -> Optional[Decimal]:
     """
     if not text or not isinstance(text, str):
         return None
+    return _sanitize_vn_str(text)
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_vn_str(text: str) -> Optional[Decimal]:
+    """Memoized body of sanitize_vn_number for non-empty str inputs."""
+    # Superscripts and other non-decimal digits ('100 m²') are not numbers;
+    # \d would strip them, so reject them explicitly as Decimal used to
+    if not text.isascii() and any(c.isdigit() and not c.isdecimal() for c in text):
+        return None
 
     try:
-        cleaned = text.strip()
-        cleaned = "".join(c for c in cleaned if c.isdigit() or c in ".,")
+        cleaned = _NON_NUMERIC_RE.sub("", text)
 
         if not cleaned:
             return None
@@ -75,6 +101,15 @@ def sanitize_vn_number(text: str) -> Optional[Decimal]:
         return None
 
 
+def _get_cache_lock(cache_key: str) -> threading.Lock:
+    """Return the lock serializing fetches and cache writes for a key."""
+    with _cache_locks_guard:
+        lock = _cache_locks.get(cache_key)
+        if lock is None:
+            lock = _cache_locks[cache_key] = threading.Lock()
+        return lock
+
+
 def _get_cache_path(cache_key: str) -> str:
     """Generate cache file path for a given key."""
     os.makedirs(CACHE_DIR, exist_ok=True)
@@ -122,8 +157,8 @@ def _deserialize_from_cache(obj: Any) -> Any:
     return obj
 
 
-def _read_cache(cache_key: str) -> Optional[dict]:
-    """Read cache data if it exists and is valid."""
+def _read_cache(cache_key: str, max_age: Optional[float] = None) -> Optional[dict]:
+    """Read cache data if it exists and is younger than max_age (default TTL)."""
     cache_path = _get_cache_path(cache_key)
 
     if not os.path.exists(cache_path):
@@ -136,7 +171,7 @@ def _read_cache(cache_key: str) -> Optional[dict]:
         timestamp = cache_data.get("timestamp", 0)
         age_seconds = time.time() - timestamp
 
-        if age_seconds < CACHE_TTL_SECONDS:
+        if age_seconds < (CACHE_TTL_SECONDS if max_age is None else max_age):
             serialized_data = cache_data.get("data")
             return _deserialize_from_cache(serialized_data)
 
@@ -157,15 +192,21 @@ def _serialize_for_cache(obj: Any) -> Any:
 
 
 def _write_cache(cache_key: str, data: Any) -> None:
-    """Write data to cache with current timestamp."""
+    """
+    Write data to cache with current timestamp.
+
+    The file is written to a temporary path and atomically renamed, so
+    other processes sharing CACHE_DIR never read a half-written entry.
+    """
     cache_path = _get_cache_path(cache_key)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
 
     try:
         serialized_data = _serialize_for_cache(data)
 
         cache_data = {"timestamp": time.time(), "data": serialized_data}
 
-        with open(cache_path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(
                 cache_data,
                 f,
@@ -173,8 +214,12 @@ def _write_cache(cache_key: str, data: Any) -> None:
                 indent=2,
                 default=_serialize_for_cache,
             )
+        os.replace(tmp_path, cache_path)
     except IOError:
-        pass
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def _read_stale_cache(cache_key: str) -> Optional[dict]:
@@ -193,22 +238,71 @@ def _read_stale_cache(cache_key: str) -> Optional[dict]:
         return None
 
 
-def cached(func: Callable[..., T]) -> Callable[..., T]:
+def _refresh_in_background(
+    cache_key: str, func: Callable[..., T], args: tuple, kwargs: dict
+) -> None:
+    """Start at most one background refresh per key for stale-while-revalidate."""
+    with _cache_locks_guard:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    def refresh() -> None:
+        try:
+            with _get_cache_lock(cache_key):
+                if _read_cache(cache_key) is None:
+                    _write_cache(cache_key, func(*args, **kwargs))
+        except Exception:
+            pass  # keep serving the stale entry; the next call retries
+        finally:
+            with _cache_locks_guard:
+                _refreshing.discard(cache_key)
+
+    # Daemon so Ctrl+C in the terminal loop never waits out a fallback chain;
+    # an interrupted refresh just leaves the stale entry for the next run
+    threading.Thread(target=refresh, name=f"refresh-{cache_key}", daemon=True).start()
+
+
+def enable_stale_while_revalidate() -> None:
+    """
+    Let ``@cached(stale_ttl=...)`` serve stale entries while refreshing.
+
+    Only long-running processes (the terminal dashboard loop) should call
+    this; they pick up the refreshed value on their next fetch.
+    """
+    global _stale_while_revalidate
+    _stale_while_revalidate = True
+
+
+def cached(
+    func: Optional[Callable[..., T]] = None, *, stale_ttl: Optional[int] = None
+) -> Callable[..., T]:
     """
     Decorator that caches function results with TTL-based expiration.
 
     Behavior:
     - Returns cached value if it exists and is < CACHE_TTL_SECONDS old
+    - With stale_ttl, once enable_stale_while_revalidate() was called, an
+      expired value younger than stale_ttl seconds is returned immediately
+      while one background thread refreshes it (stale-while-revalidate)
     - Otherwise calls the wrapped function
     - If function raises requests.exceptions.RequestException, returns stale cache
     - Caches successful results with timestamp
+    - Thread-safe: concurrent callers for the same key wait for one fetch
+    - Entries live in CACHE_DIR, so every process sharing that directory
+      reuses the same results within the TTL window
+
+    Usable bare (``@cached``) or with options (``@cached(stale_ttl=3600)``).
 
     Args:
         func: Function to decorate (should return dataclass model or dict)
+        stale_ttl: Max age in seconds of an entry served while revalidating
 
     Returns:
         Decorated function with caching behavior
     """
+    if func is None:
+        return lambda f: cached(f, stale_ttl=stale_ttl)
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
@@ -217,18 +311,25 @@ def cached(func: Callable[..., T]) -> Callable[..., T]:
         else:
             cache_key = f"{func.__name__}"
 
-        cached_data = _read_cache(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        try:
-            result = func(*args, **kwargs)
-            _write_cache(cache_key, result)
-            return result
-        except requests.exceptions.RequestException:
-            stale_data = _read_stale_cache(cache_key)
-            if stale_data is not None:
-                return stale_data
-            raise
+        with _get_cache_lock(cache_key):
+            cached_data = _read_cache(cache_key)
+            if cached_data is not None:
+                return cached_data
+
+            if stale_ttl is not None and _stale_while_revalidate:
+                stale_data = _read_cache(cache_key, max_age=stale_ttl)
+                if stale_data is not None:
+                    _refresh_in_background(cache_key, func, args, kwargs)
+                    return stale_data
+
+            try:
+                result = func(*args, **kwargs)
+                _write_cache(cache_key, result)
+                return result
+            except requests.exceptions.RequestException:
+                stale_data = _read_stale_cache(cache_key)
+                if stale_data is not None:
+                    return stale_data
+                raise
 
     return wrapper
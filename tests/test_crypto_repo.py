@@ -0,0 +1,93 @@
+"""Regression tests for CryptoRepository parsing and fallback behavior."""
+
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from gold_dashboard.repositories.crypto_repo import CryptoRepository
+
+
+def _html_response(body: str) -> MagicMock:
+    """Build a mocked successful HTML response."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.content = body.encode("utf-8")
+    response.iter_content.side_effect = lambda chunk_size=1: iter([response.content])
+    response.__enter__.return_value = response
+    return response
+
+
+class TestCryptoRepository(unittest.TestCase):
+    """Ensure BTC/VND extraction survives markup changes and source outages."""
+
+    @patch("gold_dashboard.repositories.crypto_repo.SESSION.get")
+    def test_extracts_rate_from_price_class(self, mock_get: MagicMock) -> None:
+        """Elements whose class mentions price/value/amount are checked first."""
+        mock_get.return_value = _html_response(
+            "<html><body>"
+            '<p class="subtitle">1 BTC</p>'
+            '<span class="sc-Converter-Price big">2.512.345.678</span>'
+            "</body></html>"
+        )
+
+        repo = CryptoRepository()
+        result = CryptoRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "CoinMarketCap")
+        self.assertEqual(result.btc_to_vnd, Decimal("2512345678"))
+
+    @patch("gold_dashboard.repositories.crypto_repo.SESSION.get")
+    def test_extracts_space_grouped_rate_from_price_class(
+        self, mock_get: MagicMock
+    ) -> None:
+        """Space-grouped prices survive the BTC-sized XPath pre-filter."""
+        mock_get.return_value = _html_response(
+            "<html><body>"
+            '<span class="sc-Converter-Price big">2 500 000 000</span>'
+            "</body></html>"
+        )
+
+        repo = CryptoRepository()
+        result = CryptoRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "CoinMarketCap")
+        self.assertEqual(result.btc_to_vnd, Decimal("2500000000"))
+
+    @patch("gold_dashboard.repositories.crypto_repo.SESSION.get")
+    def test_extracts_rate_near_currency_keyword(self, mock_get: MagicMock) -> None:
+        """Without price classes, a number near a BTC/VND label is used."""
+        mock_get.return_value = _html_response(
+            "<html><body>"
+            "<div>Bitcoin to VND</div>\n"
+            "<div>1,980,000,000</div>\n"
+            "</body></html>"
+        )
+
+        repo = CryptoRepository()
+        result = CryptoRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.btc_to_vnd, Decimal("1980000000"))
+
+    @patch("gold_dashboard.repositories.crypto_repo.SESSION.get")
+    def test_falls_back_to_coingecko(self, mock_get: MagicMock) -> None:
+        """CoinGecko is used when CoinMarketCap is unreachable."""
+        coingecko_ok = MagicMock()
+        coingecko_ok.raise_for_status = MagicMock()
+        coingecko_ok.json.return_value = {"bitcoin": {"vnd": 2450000000}}
+
+        mock_get.side_effect = [
+            requests.exceptions.ConnectionError("cmc down"),
+            coingecko_ok,
+        ]
+
+        repo = CryptoRepository()
+        result = CryptoRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "CoinGecko")
+        self.assertEqual(result.btc_to_vnd, Decimal("2450000000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
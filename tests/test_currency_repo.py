@@ -0,0 +1,212 @@
+"""Regression tests for CurrencyRepository parsing and fallback behavior."""
+
+import socket
+import threading
+import time
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from gold_dashboard.config import OPEN_ER_API_URL, REQUEST_TIMEOUT
+from gold_dashboard.repositories._http import API_HEADERS
+from gold_dashboard.repositories.currency_repo import CurrencyRepository
+
+
+def _html_response(body: str) -> MagicMock:
+    """Build a mocked successful HTML response."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.content = body.encode("utf-8")
+    response.iter_content.side_effect = lambda chunk_size=1: iter([response.content])
+    response.__enter__.return_value = response
+    return response
+
+
+class TestCurrencyRepository(unittest.TestCase):
+    """Ensure the USD/VND fallback chain and EGCurrency parsing stay intact."""
+
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_uses_chogia_latest_entry(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+    ) -> None:
+        """chogia.vn is the primary source and its latest entry wins."""
+        chogia_ok = MagicMock()
+        chogia_ok.raise_for_status = MagicMock()
+        chogia_ok.json.return_value = {
+            "success": True,
+            "data": [{"gia_ban": "26100"}, {"gia_ban": "26350"}],
+        }
+        mock_post.return_value = chogia_ok
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "chogia.vn")
+        self.assertEqual(result.sell_rate, Decimal("26350"))
+        mock_get.assert_not_called()
+
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_parses_egcurrency_sell_rate(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+    ) -> None:
+        """EGCurrency is parsed when chogia.vn is unavailable."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("chogia down")
+        mock_get.return_value = _html_response(
+            "<html><body><table>\n"
+            "<tr><td>Buy Price</td>\n<td>26 250</td></tr>\n"
+            "<tr><td>Sell Price</td>\n<td>26 480</td></tr>\n"
+            "</table></body></html>"
+        )
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "EGCurrency")
+        self.assertEqual(result.sell_rate, Decimal("26480"))
+
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_parses_egcurrency_price_class(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+    ) -> None:
+        """Without a sell label, elements with a rate/price class are used."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("chogia down")
+        mock_get.return_value = _html_response(
+            "<html><body>"
+            '<p class="note">Updated hourly</p>'
+            '<span class="Market-Rate">26 510</span>'
+            "</body></html>"
+        )
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "EGCurrency")
+        self.assertEqual(result.sell_rate, Decimal("26510"))
+
+    @patch("gold_dashboard.repositories.currency_repo.lxml.html.document_fromstring")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_skips_parsing_body_without_rate(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+        mock_parse: MagicMock,
+    ) -> None:
+        """A block page without rate markers goes straight to Open ER API."""
+        open_er_ok = MagicMock()
+        open_er_ok.raise_for_status = MagicMock()
+        open_er_ok.json.return_value = {"result": "success", "rates": {"VND": 25000}}
+
+        mock_post.side_effect = requests.exceptions.ConnectionError("chogia down")
+        mock_get.side_effect = [
+            _html_response(
+                "<html><body>Access denied. Cloudflare Ray ID: 84a1f39276045"
+                " at 2026-10-15 22:49:03 UTC</body></html>"
+            ),
+            open_er_ok,
+        ]
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "ExchangeRate API (est.)")
+        mock_parse.assert_not_called()
+
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_returns_hardcoded_fallback_when_all_sources_fail(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+    ) -> None:
+        """Static fallback should be used only when every source fails."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("down")
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "Fallback (Scraping Failed)")
+        self.assertEqual(result.sell_rate, Decimal("26500"))
+
+
+    @patch("gold_dashboard.repositories.currency_repo.FALLBACK_CHAIN_BUDGET", 0)
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.get")
+    @patch("gold_dashboard.repositories.currency_repo.SESSION.post")
+    def test_exhausted_budget_still_tries_open_er_api(
+        self,
+        mock_post: MagicMock,
+        mock_get: MagicMock,
+    ) -> None:
+        """A spent budget skips the scrapers but Open ER API keeps its timeout."""
+        open_er_ok = MagicMock()
+        open_er_ok.raise_for_status = MagicMock()
+        open_er_ok.json.return_value = {"result": "success", "rates": {"VND": 25000}}
+        mock_get.return_value = open_er_ok
+
+        repo = CurrencyRepository()
+        result = CurrencyRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "ExchangeRate API (est.)")
+        mock_post.assert_not_called()
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args.args[0], OPEN_ER_API_URL)
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], REQUEST_TIMEOUT)
+        self.assertIs(mock_get.call_args.kwargs["headers"], API_HEADERS)
+
+    @patch("gold_dashboard.repositories.currency_repo.FALLBACK_CHAIN_BUDGET", 1)
+    @patch.object(CurrencyRepository, "_fetch_from_open_er_api")
+    @patch.object(CurrencyRepository, "_fetch_from_chogia")
+    def test_hung_endpoint_respects_budget(
+        self,
+        mock_chogia: MagicMock,
+        mock_open_er: MagicMock,
+    ) -> None:
+        """A source that accepts but never answers is given up at the deadline."""
+        mock_chogia.side_effect = requests.exceptions.ConnectionError("chogia down")
+        mock_open_er.side_effect = requests.exceptions.ConnectionError("open er down")
+
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        accepted = []
+
+        def _accept() -> None:
+            while True:
+                try:
+                    accepted.append(server.accept()[0])
+                except OSError:
+                    return
+
+        threading.Thread(target=_accept, daemon=True).start()
+        hung_url = f"http://127.0.0.1:{server.getsockname()[1]}/"
+        try:
+            with patch(
+                "gold_dashboard.repositories.currency_repo.EGCURRENCY_URL", hung_url
+            ):
+                started = time.monotonic()
+                result = CurrencyRepository.fetch.__wrapped__(CurrencyRepository())
+                elapsed = time.monotonic() - started
+        finally:
+            server.close()
+            for conn in accepted:
+                conn.close()
+
+        self.assertEqual(result.source, "Fallback (Scraping Failed)")
+        self.assertLess(elapsed, 2)
+        self.assertEqual(len(accepted), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
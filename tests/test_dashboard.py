@@ -0,0 +1,38 @@
+"""Tests for terminal dashboard formatting helpers."""
+
+import unittest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from gold_dashboard.dashboard import format_vn_number, get_status_color
+
+
+class TestFormatVnNumber(unittest.TestCase):
+    """Vietnamese display format uses '.' for thousands and ',' for decimals."""
+
+    def test_groups_thousands_with_dots(self) -> None:
+        self.assertEqual(format_vn_number(Decimal("25500000")), "25.500.000")
+        self.assertEqual(format_vn_number(Decimal("999")), "999")
+        self.assertEqual(format_vn_number(Decimal("1000")), "1.000")
+
+    def test_keeps_requested_decimal_places(self) -> None:
+        self.assertEqual(format_vn_number(Decimal("1234.56"), 2), "1.234,56")
+        self.assertEqual(format_vn_number(Decimal("1234.56")), "1.234")
+
+    def test_negative_and_missing_values(self) -> None:
+        self.assertEqual(format_vn_number(Decimal("-1234567.5"), 1), "-1.234.567,5")
+        self.assertEqual(format_vn_number(None), "N/A")
+
+
+class TestGetStatusColor(unittest.TestCase):
+    """Freshness colors are measured against the supplied clock reading."""
+
+    def test_thresholds_against_given_now(self) -> None:
+        now = datetime(2026, 3, 1, 9, 30)
+        self.assertEqual(get_status_color(now - timedelta(minutes=4), now), "green")
+        self.assertEqual(get_status_color(now - timedelta(minutes=5), now), "yellow")
+        self.assertEqual(get_status_color(now - timedelta(minutes=11), now), "red")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,7 @@ def test_extract_grade_price_returns_none_when_label_absent():
     assert val is None
 
 
-@patch("gold_dashboard.repositories.gasoline_repo.requests.get")
+@patch("gold_dashboard.repositories.gasoline_repo.SESSION.get")
 @patch("gold_dashboard.repositories.gasoline_repo.Path.exists")
 def test_fetch_falls_back_to_hardcoded_when_all_sources_fail(mock_exists, mock_get):
     mock_get.side_effect = requests.exceptions.RequestException("network down")
@@ -82,6 +82,20 @@ class TestGenerateDataSerialization(unittest.TestCase):
         payload = serialize_data(DashboardData())
         self.assertNotIn("land", payload)
 
+    def test_serialize_data_keeps_zero_values(self) -> None:
+        data = DashboardData(
+            vn30=Vn30Index(
+                index_value=Decimal("2020.12"),
+                change_percent=Decimal("0"),
+                source="VPS",
+            )
+        )
+
+        payload = serialize_data(data)
+
+        self.assertEqual(payload["vn30"]["change_percent"], Decimal("0"))
+        self.assertEqual(payload["vn30"]["index_value"], Decimal("2020.12"))
+
 
 class TestMergeCurrentIntoTimeseries(unittest.TestCase):
     """Ensure latest card values and chart values stay in sync."""
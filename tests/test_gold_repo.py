@@ -0,0 +1,246 @@
+"""Regression tests for GoldRepository parsing and fallback behavior."""
+
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from gold_dashboard.config import DOJI_API_URL, MIHONG_URL
+from gold_dashboard.repositories import gold_repo
+from gold_dashboard.repositories.gold_repo import GoldRepository
+
+
+def _mock_response(body: str, headers: Optional[dict] = None) -> MagicMock:
+    """Build a mocked successful response with the given body."""
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+    response.content = body.encode("utf-8")
+    response.iter_content.side_effect = lambda chunk_size=1: iter([response.content])
+    response.__enter__.return_value = response
+    return response
+
+
+def _by_url(doji, mihong):
+    """Route concurrent SESSION.get calls to per-source results."""
+    outcomes = {DOJI_API_URL: doji, MIHONG_URL: mihong}
+
+    def _get(url, **kwargs):
+        outcome = outcomes[url]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return _get
+
+
+DOJI_XML = """<?xml version="1.0" encoding="utf-8"?>
+<GoldList>
+  <DGPlist>
+    <Row Name="DOJI HN buôn" Key="a" Sell="17,500" Buy="17,200" />
+    <Row Name="DOJI HCM buôn" Key="b" Sell="17,520" Buy="17,220" />
+    <Row Name="DOJI HCM lẻ" Key="c" Sell="17,540" Buy="17,240" />
+  </DGPlist>
+</GoldList>
+"""
+
+
+DOJI_XML_WITHOUT_RETAIL = """<?xml version="1.0" encoding="utf-8"?>
+<GoldList>
+  <JewelryList>
+    <Row Name="Nhẫn HCM lẻ" Key="j" Sell="9,900" Buy="9,800" />
+  </JewelryList>
+  <DGPlist>
+    <Row Name="DOJI HN buôn" Key="a" Sell="17,500" Buy="17,200" />
+    <Row Name="DOJI HCM buôn" Key="b" Sell="17,520" Buy="17,220" />
+  </DGPlist>
+</GoldList>
+"""
+
+
+class TestGoldRepository(unittest.TestCase):
+    """Ensure gold source priority and Mi Hồng parsing stay intact."""
+
+    def setUp(self) -> None:
+        gold_repo._revalidation.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self._last_good = os.path.join(self._tmp.name, "last_gold_scrape.json")
+        self._patch = patch(
+            "gold_dashboard.repositories.gold_repo.GOLD_LAST_GOOD_SCRAPE_FILE",
+            self._last_good,
+        )
+        self._patch.start()
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_doji_prefers_hcm_retail_row(self, mock_get: MagicMock) -> None:
+        """The HCM retail row wins over other HCM rows."""
+        mock_get.return_value = _mock_response(DOJI_XML)
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "DOJI")
+        self.assertEqual(result.sell_price, Decimal("175400000"))
+        self.assertEqual(result.buy_price, Decimal("172400000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_doji_stops_reading_after_retail_row(self, mock_get: MagicMock) -> None:
+        """Chunks after the HCM retail row are never pulled from the stream."""
+        head, _, _ = DOJI_XML.partition("  </DGPlist>")
+        response = _mock_response(DOJI_XML)
+        response.iter_content.side_effect = lambda chunk_size=1: iter(
+            [head.encode("utf-8"), b"<<< not xml"]
+        )
+        mock_get.return_value = response
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "DOJI")
+        self.assertEqual(result.sell_price, Decimal("175400000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_doji_falls_back_to_first_hcm_row(self, mock_get: MagicMock) -> None:
+        """Without a DGPlist retail row, the first DGPlist HCM row is used."""
+        mock_get.return_value = _mock_response(DOJI_XML_WITHOUT_RETAIL)
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "DOJI")
+        self.assertEqual(result.sell_price, Decimal("175200000"))
+        self.assertEqual(result.buy_price, Decimal("172200000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_mihong_table_extraction(self, mock_get: MagicMock) -> None:
+        """Mi Hồng SJC table row is parsed when DOJI is unavailable."""
+        mock_get.side_effect = _by_url(
+            requests.exceptions.ConnectionError("doji down"),
+            _mock_response(
+                "<html><body><table>\n"
+                "<tr><th>Loại</th><th>Mua</th><th>Bán</th></tr>\n"
+                "<tr><td>SJC 1L</td><td>82.000.000</td><td>84.000.000</td></tr>\n"
+                "</table></body></html>"
+            ),
+        )
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "Mi Hồng")
+        self.assertEqual(result.buy_price, Decimal("82000000"))
+        self.assertEqual(result.sell_price, Decimal("84000000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_mihong_text_extraction(self, mock_get: MagicMock) -> None:
+        """Without a table, buy/sell labels after an SJC line are used."""
+        mock_get.side_effect = _by_url(
+            requests.exceptions.ConnectionError("doji down"),
+            _mock_response(
+                "<html><body>\n"
+                "<div>Vàng SJC</div>\n"
+                "<div>Giá mua</div>\n"
+                "<div>81.500.000</div>\n"
+                "<div>Giá bán</div>\n"
+                "<div>83.500.000</div>\n"
+                "</body></html>"
+            ),
+        )
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "Mi Hồng")
+        self.assertEqual(result.buy_price, Decimal("81500000"))
+        self.assertEqual(result.sell_price, Decimal("83500000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_doji_wins_when_both_sources_respond(self, mock_get: MagicMock) -> None:
+        """Concurrent fetching keeps DOJI ahead of Mi Hồng."""
+        mock_get.side_effect = _by_url(
+            _mock_response(DOJI_XML),
+            _mock_response(
+                "<html><body><table>\n"
+                "<tr><td>SJC 1L</td><td>82.000.000</td><td>84.000.000</td></tr>\n"
+                "</table></body></html>"
+            ),
+        )
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "DOJI")
+        self.assertEqual(result.sell_price, Decimal("175400000"))
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_doji_not_modified_reuses_last_price(self, mock_get: MagicMock) -> None:
+        """A 304 answer to If-None-Match re-serves the previously parsed price."""
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.__enter__.return_value = not_modified
+
+        mock_get.side_effect = _by_url(
+            _mock_response(DOJI_XML, headers={"ETag": '"v1"'}),
+            requests.exceptions.ConnectionError("mihong down"),
+        )
+        repo = GoldRepository()
+        first = GoldRepository.fetch.__wrapped__(repo)
+
+        mock_get.side_effect = _by_url(
+            not_modified,
+            requests.exceptions.ConnectionError("mihong down"),
+        )
+        second = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(second.source, "DOJI")
+        self.assertEqual(second.sell_price, first.sell_price)
+        doji_calls = [
+            call for call in mock_get.call_args_list if call.args[0] == DOJI_API_URL
+        ]
+        self.assertEqual(doji_calls[0].kwargs["headers"], {})
+        self.assertEqual(doji_calls[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+        not_modified.raise_for_status.assert_not_called()
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_falls_back_to_static_price(self, mock_get: MagicMock) -> None:
+        """Static fallback should be used only when every source fails."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        repo = GoldRepository()
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "Fallback (Scraping Failed)")
+
+    @patch("gold_dashboard.repositories.gold_repo.SESSION.get")
+    def test_falls_back_to_last_good_scrape(self, mock_get: MagicMock) -> None:
+        """A persisted successful scrape beats the static fallback."""
+        mock_get.side_effect = _by_url(
+            _mock_response(DOJI_XML),
+            requests.exceptions.ConnectionError("mihong down"),
+        )
+        repo = GoldRepository()
+        GoldRepository.fetch.__wrapped__(repo)
+
+        with open(self._last_good, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["sell_price"], "175400000")
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        result = GoldRepository.fetch.__wrapped__(repo)
+
+        self.assertEqual(result.source, "DOJI (cached)")
+        self.assertEqual(result.sell_price, Decimal("175400000"))
+        self.assertEqual(result.buy_price, Decimal("172400000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,14 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
 
+import orjson
+import requests
+
 from gold_dashboard.config import HISTORY_PERIODS
+from gold_dashboard import history_store
 from gold_dashboard.history_store import (
     record_snapshot,
+    record_snapshots_bulk,
     get_value_at,
     get_all_entries,
     _load_history,
@@ -31,6 +36,7 @@ from gold_dashboard.models import (
     UsdVndRate,
     Vn30Index,
 )
+from gold_dashboard.repositories import history_repo
 from gold_dashboard.repositories.history_repo import (
     HistoryRepository,
     _compute_change_percent,
@@ -38,10 +44,21 @@ from gold_dashboard.repositories.history_repo import (
     _GASOLINE_HISTORICAL_SEEDS,
     _LAND_HISTORICAL_SEEDS,
     _USD_VND_HISTORICAL_SEEDS,
+    _USD_VND_SEED_INDEX,
     _VN30_HISTORICAL_SEEDS,
 )
 
 
+def _streamed_response(*chunks: bytes) -> MagicMock:
+    """Build a mocked streamed response yielding the given body chunks."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.encoding = "utf-8"
+    response.iter_content.side_effect = lambda chunk_size=1: iter(chunks)
+    response.__enter__.return_value = response
+    return response
+
+
 class TestComputeChangePercent(unittest.TestCase):
     """Test the percentage change helper."""
 
@@ -62,6 +79,37 @@ class TestComputeChangePercent(unittest.TestCase):
         self.assertEqual(result, Decimal("0"))
 
 
+class TestCircuitBreaker(unittest.TestCase):
+    """Repeatedly failing endpoints are skipped until a trial call succeeds."""
+
+    def test_open_circuit_skips_calls(self) -> None:
+        breaker = history_repo._CircuitBreaker("test", failure_threshold=2)
+        fetch = MagicMock(side_effect=ValueError("down"))
+        guarded = breaker(fetch)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                guarded()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            guarded()
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_successful_trial_closes_circuit(self) -> None:
+        breaker = history_repo._CircuitBreaker(
+            "test", failure_threshold=1, recovery_timeout=0
+        )
+        fetch = MagicMock(side_effect=[ValueError("down"), "ok", "ok"])
+        guarded = breaker(fetch)
+
+        with self.assertRaises(ValueError):
+            guarded()
+
+        self.assertEqual(guarded(), "ok")
+        self.assertEqual(guarded(), "ok")
+        self.assertEqual(fetch.call_count, 3)
+
+
 class TestHistoryStore(unittest.TestCase):
     """Test the local JSON history store (uses a temp file)."""
 
@@ -113,6 +161,15 @@ class TestHistoryStore(unittest.TestCase):
         value = get_value_at("gold", datetime(2025, 6, 2))
         self.assertEqual(value, Decimal("100"))
 
+    def test_get_value_at_prefers_earlier_day_on_tie(self) -> None:
+        """Equidistant snapshots resolve to the earlier one."""
+        for day, value in ((1, "100"), (3, "300"), (20, "2000")):
+            record_snapshot("gold", Decimal(value), datetime(2025, 6, day))
+
+        self.assertEqual(get_value_at("gold", datetime(2025, 6, 2)), Decimal("100"))
+        self.assertEqual(get_value_at("gold", datetime(2025, 6, 4)), Decimal("300"))
+        self.assertIsNone(get_value_at("gold", datetime(2025, 6, 30)))
+
     def test_get_value_at_too_far(self) -> None:
         """Should return None if closest snapshot is beyond tolerance."""
         record_snapshot("gold", Decimal("100"), datetime(2025, 1, 1))
@@ -143,10 +200,40 @@ class TestHistoryStore(unittest.TestCase):
         self.assertEqual(get_value_at("gold", ts), Decimal("100"))
         self.assertEqual(get_value_at("bitcoin", ts), Decimal("999"))
 
+    def test_bulk_record_saves_once_and_deduplicates(self) -> None:
+        """A batch is written in one save and merges same-day entries."""
+        record_snapshot("gold", Decimal("100"), datetime(2025, 6, 1, 9, 0, 0))
+
+        with patch(
+            "gold_dashboard.history_store._save_history",
+            wraps=history_store._save_history,
+        ) as mock_save:
+            record_snapshots_bulk(
+                "gold",
+                [
+                    (datetime(2025, 6, 3), Decimal("300")),
+                    (datetime(2025, 6, 1, 15, 0, 0), Decimal("150")),
+                    (datetime(2025, 6, 2), Decimal("200")),
+                ],
+            )
+
+        self.assertEqual(mock_save.call_count, 1)
+        entries = get_all_entries("gold")
+        self.assertEqual(
+            [(e["date"], e["value"]) for e in entries],
+            [("2025-06-01", "150"), ("2025-06-02", "200"), ("2025-06-03", "300")],
+        )
+
 
 class TestHistoryRepository(unittest.TestCase):
     """Test HistoryRepository with mocked external API calls."""
 
+    def setUp(self) -> None:
+        history_repo._history_memo.clear()
+        history_repo._seeded_assets.clear()
+        for breaker in history_repo._CIRCUIT_BREAKERS:
+            breaker.reset()
+
     def _make_dashboard_data(self) -> DashboardData:
         return DashboardData(
             gold=GoldPrice(
@@ -164,10 +251,10 @@ class TestHistoryRepository(unittest.TestCase):
             ),
         )
 
-    @patch("gold_dashboard.repositories.history_repo.record_snapshot")
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_fetch_changes_returns_all_assets(
         self,
         mock_get: MagicMock,
@@ -201,15 +288,114 @@ class TestHistoryRepository(unittest.TestCase):
                 list(HISTORY_PERIODS.keys()),
             )
 
-    @patch("gold_dashboard.repositories.history_repo.record_snapshot")
+    @patch("gold_dashboard.repositories.history_repo.get_all_entries")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
+    def test_fetch_timeseries_keeps_asset_order(
+        self,
+        mock_get: MagicMock,
+        mock_post: MagicMock,
+        mock_entries: MagicMock,
+    ) -> None:
+        """Concurrently fetched series come back in a fixed asset order."""
+        import requests.exceptions
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("network down")
+        mock_post.side_effect = requests.exceptions.ConnectionError("network down")
+        mock_entries.return_value = []
+
+        result = HistoryRepository().fetch_timeseries()
+
+        self.assertEqual(
+            list(result),
+            ["gold", "usd_vnd", "bitcoin", "vn30", "land", "gasoline"],
+        )
+        self.assertEqual(result["gold"][0], ["2023-01-15", 66500000.0])
+        self.assertEqual(result["vn30"], [])
+
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    def test_history_fetches_are_memoized(self, mock_post: MagicMock) -> None:
+        """A second consumer within the TTL reuses the first payload."""
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.content = orjson.dumps(
+            {"success": True, "data": [{"ngay": "2026-02-10", "gia_ban": "25813"}]}
+        )
+        mock_post.return_value = response
+
+        first = HistoryRepository()._fetch_chogia_history()
+        second = HistoryRepository()._fetch_chogia_history()
+
+        self.assertEqual(first, {"2026-02-10": Decimal("25813")})
+        self.assertIs(second, first)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
+    @patch("gold_dashboard.repositories.history_repo.get_value_at")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
+    def test_gold_changes_reuse_timeseries_fetches(
+        self,
+        mock_get: MagicMock,
+        mock_post: MagicMock,
+        mock_local: MagicMock,
+        mock_record: MagicMock,
+    ) -> None:
+        """Changes computed after the timeseries make no new gold requests."""
+        webgia = _streamed_response(
+            '<script>var seriesOptions = [{name:"Bán ra",'
+            "data:[[1735689600000, 84.5]]}]</script>".encode("utf-8")
+        )
+        chogia = MagicMock()
+        chogia.raise_for_status = MagicMock()
+        chogia.content = orjson.dumps(
+            {"success": True, "data": [{"ngay": "01/01", "gia_ban": "84500"}]}
+        )
+        mock_get.return_value = webgia
+        mock_post.return_value = chogia
+        mock_local.return_value = None
+
+        repo = HistoryRepository()
+        repo._gold_timeseries()
+        repo._gold_changes(Decimal("181000000"))
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
+    def test_webgia_stream_stops_after_sell_series(self, mock_get: MagicMock) -> None:
+        """The label may straddle chunks; chunks after the series stay unread."""
+        page = (
+            "<html>" + "<p>filler</p>" * 50 + '<script>var seriesOptions = '
+            '[{name:"Bán ra",data:[[1735689600000, 84.5]]}]'
+        ).encode("utf-8")
+        split = page.index("Bán".encode("utf-8")) + 2
+        chunks = iter([page[:split], page[split:], b"</script></html>"])
+        response = _streamed_response()
+        response.iter_content.side_effect = lambda chunk_size=1: chunks
+        mock_get.return_value = response
+
+        rates = HistoryRepository()._fetch_webgia_gold_history()
+
+        self.assertEqual(list(rates.values()), [Decimal("84500000.0")])
+        self.assertEqual(next(chunks), b"</script></html>")
+
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_gold_webgia_success(
-        self, mock_get: MagicMock, mock_local: MagicMock, mock_record: MagicMock
+        self,
+        mock_get: MagicMock,
+        mock_post: MagicMock,
+        mock_local: MagicMock,
+        mock_record: MagicMock,
     ) -> None:
         """When webgia.com returns 1Y of SJC data, gold 1W/1M/1Y should be computed."""
         import json as _json
 
+        mock_post.side_effect = requests.exceptions.ConnectionError("chogia down")
+
         now = datetime.now()
 
         # Build fake webgia.com inline Highcharts data spanning ~1 year.
@@ -227,9 +413,7 @@ class TestHistoryRepository(unittest.TestCase):
         )
         fake_html = f"<html><script>{inline_js}</script></html>"
 
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = fake_html
+        mock_response = _streamed_response(fake_html.encode("utf-8"))
         mock_get.return_value = mock_response
         mock_local.return_value = None
 
@@ -250,10 +434,10 @@ class TestHistoryRepository(unittest.TestCase):
         # Backfill should have been called
         self.assertTrue(mock_record.called)
 
-    @patch("gold_dashboard.repositories.history_repo.record_snapshot")
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_gold_falls_back_to_chogia(
         self,
         mock_get: MagicMock,
@@ -282,7 +466,7 @@ class TestHistoryRepository(unittest.TestCase):
 
         mock_post_response = MagicMock()
         mock_post_response.raise_for_status = MagicMock()
-        mock_post_response.json.return_value = {"success": True, "data": entries}
+        mock_post_response.content = orjson.dumps({"success": True, "data": entries})
         mock_post.return_value = mock_post_response
         mock_local.return_value = None
 
@@ -294,10 +478,45 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertIsNotNone(change_map["1W"].change_percent, "1W from chogia fallback")
         self.assertIsNotNone(change_map["1M"].change_percent, "1M from chogia fallback")
 
-    @patch("gold_dashboard.repositories.history_repo.record_snapshot")
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
+    def test_gold_chogia_overrides_webgia_on_same_day(
+        self,
+        mock_get: MagicMock,
+        mock_post: MagicMock,
+        mock_local: MagicMock,
+        mock_record: MagicMock,
+    ) -> None:
+        """Both sources are fetched; chogia.vn wins a date webgia also covers."""
+        week_ago = (datetime.now() - timedelta(days=7)).date()
+        ts_ms = (week_ago.toordinal() - datetime(1970, 1, 1).toordinal()) * 86_400_000
+        mock_get.return_value = _streamed_response(
+            '<script>var seriesOptions = [{name:"Bán ra",'
+            f"data:[[{ts_ms}, 84.5]]}}]</script>".encode("utf-8")
+        )
+        chogia = MagicMock()
+        chogia.raise_for_status = MagicMock()
+        chogia.content = orjson.dumps(
+            {
+                "success": True,
+                "data": [{"ngay": week_ago.strftime("%d/%m"), "gia_ban": "85000"}],
+            }
+        )
+        mock_post.return_value = chogia
+        mock_local.return_value = None
+
+        result = HistoryRepository()._gold_changes(Decimal("181000000"))
+
+        change_map = {c.period: c for c in result.changes}
+        self.assertEqual(change_map["1W"].old_value, Decimal("85000000"))
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
+    @patch("gold_dashboard.repositories.history_repo.get_value_at")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_gold_falls_back_to_local_store(
         self,
         mock_get: MagicMock,
@@ -324,8 +543,8 @@ class TestHistoryRepository(unittest.TestCase):
             self.assertIsNotNone(change.old_value)
 
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_gold_3y_uses_seed_nearest_when_local_misses(
         self,
         mock_get: MagicMock,
@@ -352,7 +571,7 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertIsNotNone(change_map["3Y"].change_percent)
 
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_bitcoin_coingecko_success(
         self, mock_get: MagicMock, mock_local: MagicMock
     ) -> None:
@@ -380,7 +599,7 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertTrue(has_data)
 
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_vn30_vps_success(self, mock_get: MagicMock, mock_local: MagicMock) -> None:
         """When VPS API returns data, VN30 changes should be computed."""
         import time as _time
@@ -408,7 +627,7 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertTrue(has_data)
 
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_vn30_short_periods_do_not_use_seed_fallback(
         self, mock_get: MagicMock, mock_local: MagicMock
     ) -> None:
@@ -431,7 +650,7 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertIsNone(change_map["1M"].old_value)
 
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_vn30_3y_uses_seed_fallback_when_vps_and_local_miss(
         self, mock_get: MagicMock, mock_local: MagicMock
     ) -> None:
@@ -452,7 +671,7 @@ class TestHistoryRepository(unittest.TestCase):
         self.assertEqual(change_map["3Y"].old_value, Decimal("1087.36"))
         self.assertIsNotNone(change_map["3Y"].change_percent)
 
-    @patch("gold_dashboard.repositories.history_repo.record_snapshot")
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
     @patch("gold_dashboard.repositories.history_repo.get_value_at")
     def test_seed_historical_vn30_does_not_overwrite_existing_snapshot(
         self, mock_local: MagicMock, mock_record: MagicMock
@@ -470,19 +689,37 @@ class TestHistoryRepository(unittest.TestCase):
 
         HistoryRepository._seed_historical_vn30()
 
-        called_days = {
-            call.args[2].strftime("%Y-%m-%d") for call in mock_record.call_args_list
-        }
+        mock_record.assert_called_once()
+        asset, snapshots = mock_record.call_args.args
+        self.assertEqual(asset, "vn30")
+        called_days = {dt.strftime("%Y-%m-%d") for dt, _ in snapshots}
         self.assertNotIn(existing_date_str, called_days)
-        self.assertEqual(
-            len(mock_record.call_args_list), len(_VN30_HISTORICAL_SEEDS) - 1
-        )
+        self.assertEqual(len(snapshots), len(_VN30_HISTORICAL_SEEDS) - 1)
+
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
+    @patch("gold_dashboard.repositories.history_repo.get_value_at")
+    def test_seed_historical_vn30_probes_store_once(
+        self, mock_local: MagicMock, mock_record: MagicMock
+    ) -> None:
+        """Repeated VN30 seeding neither re-probes nor rewrites the store."""
+        mock_local.return_value = None
+
+        HistoryRepository._seed_historical_vn30()
+        probes = mock_local.call_count
+        HistoryRepository._seed_historical_vn30()
+
+        self.assertEqual(mock_local.call_count, probes)
+        mock_record.assert_called_once()
 
 
 class TestUsdVndSeeds(unittest.TestCase):
     """Test USD/VND historical seed and backfill methods."""
 
     def setUp(self) -> None:
+        history_repo._history_memo.clear()
+        history_repo._seeded_assets.clear()
+        for breaker in history_repo._CIRCUIT_BREAKERS:
+            breaker.reset()
         self._tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
         self._tmp.close()
         self._patch = patch("gold_dashboard.history_store.HISTORY_FILE", self._tmp.name)
@@ -508,8 +745,16 @@ class TestUsdVndSeeds(unittest.TestCase):
             value = get_value_at("usd_vnd", dt)
             self.assertEqual(value, expected, f"Seed {date_str} not found")
 
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.record_snapshots_bulk")
+    def test_seed_writes_once_per_process(self, mock_record: MagicMock) -> None:
+        """Repeated seeding calls after the first do not touch the store."""
+        HistoryRepository._seed_historical_usd_vnd()
+        HistoryRepository._seed_historical_usd_vnd()
+
+        mock_record.assert_called_once()
+
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_usd_vnd_changes_wires_seeds(
         self, mock_get: MagicMock, mock_post: MagicMock
     ) -> None:
@@ -539,14 +784,30 @@ class TestUsdVndSeeds(unittest.TestCase):
     def test_find_seed_rate_uses_nearest_anchor_within_window(self) -> None:
         """Nearest monthly seed should be returned when target date lacks an exact local snapshot."""
         target = datetime(2025, 2, 20)
-        value = HistoryRepository._find_seed_rate(_USD_VND_HISTORICAL_SEEDS, target)
+        value = HistoryRepository._find_seed_rate(_USD_VND_SEED_INDEX, target)
         self.assertEqual(value, Decimal("25855"))
 
+    def test_find_chogia_rate_prefers_nearest_later_day(self) -> None:
+        """The nearest chogia.vn day within ±3 wins, the later one on ties."""
+        rates = {
+            "2025-02-18": Decimal("25800"),
+            "2025-02-22": Decimal("25900"),
+        }
+        find = HistoryRepository._find_chogia_rate
+
+        self.assertEqual(find(rates, datetime(2025, 2, 20, 9, 0)), Decimal("25900"))
+        self.assertEqual(find(rates, datetime(2025, 2, 19)), Decimal("25800"))
+        self.assertIsNone(find(rates, datetime(2025, 2, 26)))
+
 
 class TestBitcoinSeeds(unittest.TestCase):
     """Test Bitcoin historical seed and backfill methods."""
 
     def setUp(self) -> None:
+        history_repo._history_memo.clear()
+        history_repo._seeded_assets.clear()
+        for breaker in history_repo._CIRCUIT_BREAKERS:
+            breaker.reset()
         self._tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
         self._tmp.close()
         self._patch = patch("gold_dashboard.history_store.HISTORY_FILE", self._tmp.name)
@@ -572,8 +833,8 @@ class TestBitcoinSeeds(unittest.TestCase):
             value = get_value_at("bitcoin", dt)
             self.assertEqual(value, expected, f"Seed {date_str} not found")
 
-    @patch("gold_dashboard.repositories.history_repo.requests.post")
-    @patch("gold_dashboard.repositories.history_repo.requests.get")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.post")
+    @patch("gold_dashboard.repositories.history_repo.SESSION.get")
     def test_bitcoin_changes_wires_seeds(
         self, mock_get: MagicMock, mock_post: MagicMock
     ) -> None:
@@ -605,6 +866,10 @@ class TestLandSeeds(unittest.TestCase):
     """Test land historical seed and wiring behavior."""
 
     def setUp(self) -> None:
+        history_repo._history_memo.clear()
+        history_repo._seeded_assets.clear()
+        for breaker in history_repo._CIRCUIT_BREAKERS:
+            breaker.reset()
         self._tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
         self._tmp.close()
         self._patch = patch("gold_dashboard.history_store.HISTORY_FILE", self._tmp.name)
@@ -635,6 +900,10 @@ class TestGasolineSeeds(unittest.TestCase):
     """Test gasoline historical seed consistency and change calculations."""
 
     def setUp(self) -> None:
+        history_repo._history_memo.clear()
+        history_repo._seeded_assets.clear()
+        for breaker in history_repo._CIRCUIT_BREAKERS:
+            breaker.reset()
         self._tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
         self._tmp.close()
         self._patch = patch("gold_dashboard.history_store.HISTORY_FILE", self._tmp.name)
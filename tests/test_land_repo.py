@@ -29,7 +29,7 @@ class TestLandRepository(unittest.TestCase):
         # 45B / 240m2
         self.assertIn(Decimal("187500000.00"), prices)
 
-    @patch("gold_dashboard.repositories.land_repo.requests.get")
+    @patch("gold_dashboard.repositories.land_repo.SESSION.get")
     def test_fetch_uses_fallback_when_source_fails(self, mock_get: MagicMock) -> None:
         import requests
 
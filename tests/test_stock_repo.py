@@ -11,7 +11,7 @@ class TestStockRepositoryFallbacks(unittest.TestCase):
     """Ensure VN30 fetch order prefers real VPS last-close over static fallback."""
 
     @patch("gold_dashboard.repositories.stock_repo.time.sleep", return_value=None)
-    @patch("gold_dashboard.repositories.stock_repo.requests.get")
+    @patch("gold_dashboard.repositories.stock_repo.SESSION.get")
     def test_uses_vps_last_close_when_short_window_is_empty(
         self,
         mock_get: MagicMock,
@@ -48,7 +48,7 @@ class TestStockRepositoryFallbacks(unittest.TestCase):
         self.assertIsNotNone(result.change_percent)
 
     @patch("gold_dashboard.repositories.stock_repo.time.sleep", return_value=None)
-    @patch("gold_dashboard.repositories.stock_repo.requests.get")
+    @patch("gold_dashboard.repositories.stock_repo.SESSION.get")
     def test_falls_back_to_static_only_after_all_sources_fail(
         self,
         mock_get: MagicMock,
@@ -65,6 +65,24 @@ class TestStockRepositoryFallbacks(unittest.TestCase):
         self.assertEqual(result.source, "Fallback (Scraping Failed)")
         self.assertEqual(result.index_value, Decimal("1950.00"))
 
+    @patch("gold_dashboard.repositories.stock_repo.time.sleep", return_value=None)
+    @patch("gold_dashboard.repositories.stock_repo.SESSION.get")
+    def test_vps_does_not_repeat_session_status_retries(
+        self,
+        mock_get: MagicMock,
+        _mock_sleep: MagicMock,
+    ) -> None:
+        """A RetryError means SESSION already retried; VPS gives up at once."""
+        import requests
+
+        mock_get.side_effect = requests.exceptions.RetryError("503 x3")
+
+        repo = StockRepository()
+        with self.assertRaises(requests.exceptions.RetryError):
+            repo._fetch_vps_closes(days_back=7)
+
+        mock_get.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
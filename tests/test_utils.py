@@ -0,0 +1,144 @@
+"""Tests for the shared number sanitizer and caching decorator."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from gold_dashboard.models import GoldPrice
+from gold_dashboard.utils import (
+    _get_cache_lock,
+    _write_cache,
+    cached,
+    sanitize_vn_number,
+)
+
+
+class TestSanitizeVnNumber(unittest.TestCase):
+    """Both Vietnamese and international number formats are accepted."""
+
+    def test_vietnamese_and_international_formats(self) -> None:
+        self.assertEqual(sanitize_vn_number("25.500.000,50"), Decimal("25500000.50"))
+        self.assertEqual(sanitize_vn_number("2,029.81"), Decimal("2029.81"))
+        self.assertEqual(sanitize_vn_number("80.000.000"), Decimal("80000000"))
+        self.assertIsNone(sanitize_vn_number("N/A"))
+
+    def test_non_decimal_digits_are_rejected(self) -> None:
+        """Unit superscripts are not silently folded into the number."""
+        self.assertIsNone(sanitize_vn_number("100 m²"))
+        self.assertIsNone(sanitize_vn_number("1.234²"))
+
+    def test_non_string_input_returns_none(self) -> None:
+        """Unhashable and other non-str inputs bypass the cache instead of raising."""
+        self.assertIsNone(sanitize_vn_number(["80.000.000"]))  # type: ignore[arg-type]
+        self.assertIsNone(sanitize_vn_number(None))  # type: ignore[arg-type]
+
+
+class _SlowRepo:
+    """Minimal repository-like class counting fetch calls."""
+
+    calls = 0
+
+    @cached
+    def fetch(self) -> GoldPrice:
+        type(self).calls += 1
+        time.sleep(0.05)
+        return GoldPrice(
+            buy_price=Decimal("82000000"),
+            sell_price=Decimal("84000000"),
+            source="test",
+            timestamp=datetime(2026, 3, 1, 9, 30),
+        )
+
+
+class TestCachedDecorator(unittest.TestCase):
+    """The disk cache round-trips models and serializes concurrent fetches."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patch = patch("gold_dashboard.utils.CACHE_DIR", self._tmp.name)
+        self._patch.start()
+        _SlowRepo.calls = 0
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def test_round_trips_dataclass_through_disk(self) -> None:
+        first = _SlowRepo().fetch()
+        second = _SlowRepo().fetch()
+
+        self.assertEqual(_SlowRepo.calls, 1)
+        self.assertEqual(second, first)
+        self.assertEqual(os.listdir(self._tmp.name), ["_SlowRepo_fetch.json"])
+
+    def test_concurrent_callers_share_one_fetch(self) -> None:
+        threads = [threading.Thread(target=_SlowRepo().fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(_SlowRepo.calls, 1)
+
+
+class _RevalidatingRepo:
+    """Repository-like class opting into stale-while-revalidate."""
+
+    calls = 0
+
+    @cached(stale_ttl=3600)
+    def fetch(self) -> GoldPrice:
+        type(self).calls += 1
+        return GoldPrice(
+            buy_price=Decimal("83000000"),
+            sell_price=Decimal("85000000"),
+            source="fresh",
+        )
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Expired entries within stale_ttl are served while a refresh runs."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patch = patch("gold_dashboard.utils.CACHE_DIR", self._tmp.name)
+        self._patch.start()
+        _RevalidatingRepo.calls = 0
+        stale = GoldPrice(
+            buy_price=Decimal("82000000"),
+            sell_price=Decimal("84000000"),
+            source="stale",
+        )
+        with patch("gold_dashboard.utils.time.time", return_value=time.time() - 1200):
+            _write_cache("_RevalidatingRepo_fetch", stale)
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def test_one_shot_run_fetches_fresh_value(self) -> None:
+        """Without the long-running opt-in, expired entries are refetched inline."""
+        self.assertEqual(_RevalidatingRepo().fetch().source, "fresh")
+        self.assertEqual(_RevalidatingRepo.calls, 1)
+
+    @patch("gold_dashboard.utils._stale_while_revalidate", True)
+    def test_serves_stale_value_and_refreshes_in_background(self) -> None:
+        self.assertEqual(_RevalidatingRepo().fetch().source, "stale")
+
+        deadline = time.monotonic() + 5
+        while _RevalidatingRepo.calls == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with _get_cache_lock("_RevalidatingRepo_fetch"):
+            pass
+
+        self.assertEqual(_RevalidatingRepo.calls, 1)
+        self.assertEqual(_RevalidatingRepo().fetch().source, "fresh")
+
+
+if __name__ == "__main__":
+    unittest.main()